@@ -1,72 +1,74 @@
 """Demo script to verify SQL diff functionality."""
 
-from sql_diff_ui.diff_engine import compare_sql
+import sys
 
-# Example 1: Simple SELECT changes
-print("=" * 80)
-print("Example 1: Column addition")
-print("=" * 80)
-sql_a = "SELECT id, name FROM users WHERE status = 'active'"
-sql_b = "SELECT id, name, email FROM users WHERE status = 'active'"
+# Output is collected here and written with a single write at the end
+out: list[str] = []
 
-result = compare_sql(sql_a, sql_b)
-print(f"\nFound {len(result.notices)} differences:\n")
-for notice in result.notices:
-    print(f"  {notice}")
+# Separator lines
+SEP80 = "=" * 80
 
-# Example 2: JOIN changes
-print("\n" + "=" * 80)
-print("Example 2: JOIN addition")
-print("=" * 80)
-sql_a = "SELECT u.id, u.name FROM users u"
-sql_b = "SELECT u.id, u.name FROM users u LEFT JOIN orders o ON u.id = o.user_id"
-
-result = compare_sql(sql_a, sql_b)
-print(f"\nFound {len(result.notices)} differences:\n")
-for notice in result.notices:
-    print(f"  {notice}")
-
-# Example 3: WHERE predicate changes
-print("\n" + "=" * 80)
-print("Example 3: WHERE condition changes")
-print("=" * 80)
-sql_a = "SELECT id FROM users WHERE status = 'active'"
-sql_b = "SELECT id FROM users WHERE status = 'active' AND role = 'admin'"
-
-result = compare_sql(sql_a, sql_b)
-print(f"\nFound {len(result.notices)} differences:\n")
-for notice in result.notices:
-    print(f"  {notice}")
-
-# Example 4: Multiple changes
-print("\n" + "=" * 80)
-print("Example 4: Multiple changes")
-print("=" * 80)
-sql_a = """
+EXAMPLES = [
+    (
+        "Example 1: Column addition",
+        "SELECT id, name FROM users WHERE status = 'active'",
+        "SELECT id, name, email FROM users WHERE status = 'active'",
+    ),
+    (
+        "Example 2: JOIN addition",
+        "SELECT u.id, u.name FROM users u",
+        "SELECT u.id, u.name FROM users u LEFT JOIN orders o ON u.id = o.user_id",
+    ),
+    (
+        "Example 3: WHERE condition changes",
+        "SELECT id FROM users WHERE status = 'active'",
+        "SELECT id FROM users WHERE status = 'active' AND role = 'admin'",
+    ),
+    (
+        "Example 4: Multiple changes",
+        """
 SELECT id, name
 FROM users
 WHERE status = 'active'
 ORDER BY created_at
 LIMIT 10
-"""
-
-sql_b = """
+""",
+        """
 SELECT id, name, email
 FROM users
 LEFT JOIN orders ON users.id = orders.user_id
 WHERE status = 'active' AND role = 'customer'
 ORDER BY updated_at DESC
 LIMIT 20
-"""
+""",
+    ),
+]
+
+
+def main():
+    """Run the examples and print their differences."""
+    from sql_diff_ui.diff_engine import compare_sql_batch
+
+    # Compare all examples in one batch so the dialect is resolved only once
+    results = compare_sql_batch([(sql_a, sql_b) for _, sql_a, sql_b in EXAMPLES])
+
+    for index, ((title, _, _), result) in enumerate(zip(EXAMPLES, results)):
+        out.append(("\n" if index else "") + SEP80)
+        out.append(title)
+        out.append(SEP80)
+        out.append(f"\nFound {len(result.notices)} differences:\n")
+        for notice in result.notices:
+            out.append(f"  {notice}")
+
+    out.append("\n" + SEP80)
+    out.append("Text Diff Preview:")
+    out.append(SEP80)
+    out.append(result.text_diff[:500] if result.text_diff else "No text diff")
+
+    out.append("\n✅ SQL Diff Engine working correctly!")
 
-result = compare_sql(sql_a, sql_b)
-print(f"\nFound {len(result.notices)} differences:\n")
-for notice in result.notices:
-    print(f"  {notice}")
+    sys.stdout.write("\n".join(out) + "\n")
 
-print("\n" + "=" * 80)
-print("Text Diff Preview:")
-print("=" * 80)
-print(result.text_diff[:500] if result.text_diff else "No text diff")
 
-print("\n✅ SQL Diff Engine working correctly!")
+if __name__ == "__main__":
+    main()
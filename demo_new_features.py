@@ -1,19 +1,35 @@
 """Demo for new features: Line number toggle and CASE statement validation."""
 
-from sql_diff_ui.sql_validator import SQLValidator
+import sys
+from functools import cache
+
+# Output is collected here and written with a single write at the end
+out: list[str] = []
+
+# Separator lines
+SEP70 = "=" * 70
+DASH70 = "-" * 70
+
+
+@cache
+def _get_validator(dialect: str = "auto"):
+    """Return a shared validator; sqlglot is only imported on first use."""
+    from sql_diff_ui.sql_validator import SQLValidator
+
+    return SQLValidator(dialect=dialect)
 
 
 def demo_case_validation():
     """Demo CASE statement validation."""
-    print("=" * 70)
-    print("DEMO: CASE Statement Validation")
-    print("=" * 70)
+    out.append(SEP70)
+    out.append("DEMO: CASE Statement Validation")
+    out.append(SEP70)
     
-    validator = SQLValidator()
+    validator = _get_validator()
     
     # Test 1: CASE without END
-    print("\n1. CASE without END:")
-    print("-" * 70)
+    out.append("\n1. CASE without END:")
+    out.append(DASH70)
     sql1 = """
     SELECT 
         id,
@@ -23,17 +39,17 @@ def demo_case_validation():
     FROM users
     """
     is_valid, errors = validator.validate_sql(sql1)
-    print(f"SQL:\n{sql1}")
-    print(f"\nValid: {is_valid}")
+    out.append(f"SQL:\n{sql1}")
+    out.append(f"\nValid: {is_valid}")
     for error in errors:
         if hasattr(error, 'line') and error.line:
-            print(f"  ❌ Line {error.line}: {error.message}")
+            out.append(f"  ❌ Line {error.line}: {error.message}")
         else:
-            print(f"  ❌ {error.message}")
+            out.append(f"  ❌ {error.message}")
     
     # Test 2: WHEN without THEN
-    print("\n\n2. WHEN without THEN:")
-    print("-" * 70)
+    out.append("\n\n2. WHEN without THEN:")
+    out.append(DASH70)
     sql2 = """
     SELECT 
         id,
@@ -44,17 +60,17 @@ def demo_case_validation():
     FROM users
     """
     is_valid, errors = validator.validate_sql(sql2)
-    print(f"SQL:\n{sql2}")
-    print(f"\nValid: {is_valid}")
+    out.append(f"SQL:\n{sql2}")
+    out.append(f"\nValid: {is_valid}")
     for error in errors:
         if hasattr(error, 'line') and error.line:
-            print(f"  ❌ Line {error.line}: {error.message}")
+            out.append(f"  ❌ Line {error.line}: {error.message}")
         else:
-            print(f"  ❌ {error.message}")
+            out.append(f"  ❌ {error.message}")
     
     # Test 3: Valid CASE statement
-    print("\n\n3. Valid CASE statement:")
-    print("-" * 70)
+    out.append("\n\n3. Valid CASE statement:")
+    out.append(DASH70)
     sql3 = """
     SELECT 
         id,
@@ -66,20 +82,20 @@ def demo_case_validation():
     FROM users
     """
     is_valid, errors = validator.validate_sql(sql3)
-    print(f"SQL:\n{sql3}")
-    print(f"\nValid: {is_valid}")
+    out.append(f"SQL:\n{sql3}")
+    out.append(f"\nValid: {is_valid}")
     if is_valid:
-        print("  ✅ SQL is valid!")
+        out.append("  ✅ SQL is valid!")
     else:
         for error in errors:
             if hasattr(error, 'line') and error.line:
-                print(f"  ❌ Line {error.line}: {error.message}")
+                out.append(f"  ❌ Line {error.line}: {error.message}")
             else:
-                print(f"  ❌ {error.message}")
+                out.append(f"  ❌ {error.message}")
     
     # Test 4: Complex CASE with multiple conditions
-    print("\n\n4. Complex CASE statement:")
-    print("-" * 70)
+    out.append("\n\n4. Complex CASE statement:")
+    out.append(DASH70)
     sql4 = """
     SELECT 
         id,
@@ -99,42 +115,44 @@ def demo_case_validation():
     WHERE active = true
     """
     is_valid, errors = validator.validate_sql(sql4)
-    print(f"SQL:\n{sql4}")
-    print(f"\nValid: {is_valid}")
+    out.append(f"SQL:\n{sql4}")
+    out.append(f"\nValid: {is_valid}")
     if is_valid:
-        print("  ✅ SQL is valid!")
+        out.append("  ✅ SQL is valid!")
     else:
         for error in errors:
             if hasattr(error, 'line') and error.line:
-                print(f"  ❌ Line {error.line}: {error.message}")
+                out.append(f"  ❌ Line {error.line}: {error.message}")
             else:
-                print(f"  ❌ {error.message}")
+                out.append(f"  ❌ {error.message}")
 
 
 def demo_ui_toggle():
     """Demo information about the UI toggle feature."""
-    print("\n\n" + "=" * 70)
-    print("NEW FEATURE: Line Number Toggle in UI")
-    print("=" * 70)
-    print("\nThe Streamlit UI now includes a 'Show line numbers' checkbox in the")
-    print("comparison options section.")
-    print("\n✅ Benefits:")
-    print("  • Toggle line numbers on/off in error SQL views")
-    print("  • Reduces visual clutter when not needed")
-    print("  • Enabled by default for quick debugging")
-    print("  • Works independently for SQL A and SQL B validation errors")
-    print("\n📝 Usage:")
-    print("  1. Run the app: make run")
-    print("  2. Look for 'Show line numbers' checkbox in options")
-    print("  3. Uncheck to hide numbered SQL views")
-    print("  4. Check to show detailed line-by-line SQL display")
-    print("\nWhen enabled, validation errors will show an expandable section")
-    print("with line-numbered SQL for easy navigation to error locations.")
+    out.append("\n\n" + SEP70)
+    out.append("NEW FEATURE: Line Number Toggle in UI")
+    out.append(SEP70)
+    out.append("\nThe Streamlit UI now includes a 'Show line numbers' checkbox in the")
+    out.append("comparison options section.")
+    out.append("\n✅ Benefits:")
+    out.append("  • Toggle line numbers on/off in error SQL views")
+    out.append("  • Reduces visual clutter when not needed")
+    out.append("  • Enabled by default for quick debugging")
+    out.append("  • Works independently for SQL A and SQL B validation errors")
+    out.append("\n📝 Usage:")
+    out.append("  1. Run the app: make run")
+    out.append("  2. Look for 'Show line numbers' checkbox in options")
+    out.append("  3. Uncheck to hide numbered SQL views")
+    out.append("  4. Check to show detailed line-by-line SQL display")
+    out.append("\nWhen enabled, validation errors will show an expandable section")
+    out.append("with line-numbered SQL for easy navigation to error locations.")
 
 
 if __name__ == "__main__":
     demo_case_validation()
     demo_ui_toggle()
-    print("\n" + "=" * 70)
-    print("Demo complete!")
-    print("=" * 70)
+    out.append("\n" + SEP70)
+    out.append("Demo complete!")
+    out.append(SEP70)
+
+    sys.stdout.write("\n".join(out) + "\n")
@@ -1,16 +1,31 @@
 """Demo script for SQL validation and beautification."""
 
-from sql_diff_ui.sql_validator import SQLValidator
+import sys
+from functools import cache
+
+# Output is collected here and written with a single write at the end
+out: list[str] = []
+
+# Separator lines
+SEP80 = "=" * 80
+
+
+@cache
+def _get_validator(dialect: str = "auto"):
+    """Return a shared validator; sqlglot is only imported on first use."""
+    from sql_diff_ui.sql_validator import SQLValidator
+
+    return SQLValidator(dialect=dialect)
 
 
 def print_separator():
-    """Print a separator line."""
-    print("=" * 80)
+    """Add a separator line to the output."""
+    out.append(SEP80)
 
 
 def demo_valid_sql():
     """Demonstrate validation of valid SQL."""
-    print("\n🟢 DEMO 1: Valid SQL Query")
+    out.append("\n🟢 DEMO 1: Valid SQL Query")
     print_separator()
 
     sql = """
@@ -19,97 +34,97 @@ def demo_valid_sql():
     order by created_at desc
     """
 
-    validator = SQLValidator()
+    validator = _get_validator()
     is_valid, beautified, errors = validator.validate_and_beautify(sql)
 
-    print(f"Original SQL:\n{sql}")
-    print(f"\nValid: {is_valid}")
+    out.append(f"Original SQL:\n{sql}")
+    out.append(f"\nValid: {is_valid}")
 
     if is_valid:
-        print(f"\n✨ Beautified SQL:\n{beautified}")
+        out.append(f"\n✨ Beautified SQL:\n{beautified}")
     else:
-        print(f"\nErrors: {[str(e) for e in errors]}")
+        out.append(f"\nErrors: {[str(e) for e in errors]}")
 
 
 def demo_invalid_syntax():
     """Demonstrate validation of SQL with syntax errors."""
-    print("\n\n🔴 DEMO 2: Invalid SQL Syntax")
+    out.append("\n\n🔴 DEMO 2: Invalid SQL Syntax")
     print_separator()
 
     sql = "SELECT * FORM users WHERE status = 'active'"
 
-    validator = SQLValidator()
+    validator = _get_validator()
     is_valid, beautified, errors = validator.validate_and_beautify(sql)
 
-    print(f"Original SQL:\n{sql}")
-    print(f"\nValid: {is_valid}")
+    out.append(f"Original SQL:\n{sql}")
+    out.append(f"\nValid: {is_valid}")
 
     if not is_valid:
-        print(f"\n❌ Validation Errors:")
+        out.append(f"\n❌ Validation Errors:")
         for error in errors:
-            print(f"  • {error}")
+            out.append(f"  • {error}")
 
 
 def demo_unbalanced_parentheses():
     """Demonstrate detection of unbalanced parentheses."""
-    print("\n\n🔴 DEMO 3: Unbalanced Parentheses")
+    out.append("\n\n🔴 DEMO 3: Unbalanced Parentheses")
     print_separator()
 
     sql = "SELECT * FROM users WHERE (status = 'active' AND role = 'admin'"
 
-    validator = SQLValidator()
+    validator = _get_validator()
     is_valid, beautified, errors = validator.validate_and_beautify(sql)
 
-    print(f"Original SQL:\n{sql}")
-    print(f"\nValid: {is_valid}")
+    out.append(f"Original SQL:\n{sql}")
+    out.append(f"\nValid: {is_valid}")
 
     if not is_valid:
-        print(f"\n❌ Validation Errors:")
+        out.append(f"\n❌ Validation Errors:")
         for error in errors:
-            print(f"  • {error}")
+            out.append(f"  • {error}")
 
 
 def demo_unbalanced_quotes():
     """Demonstrate detection of unbalanced quotes."""
-    print("\n\n🔴 DEMO 4: Unbalanced Quotes")
+    out.append("\n\n🔴 DEMO 4: Unbalanced Quotes")
     print_separator()
 
     sql = "SELECT * FROM users WHERE name = 'John"
 
-    validator = SQLValidator()
+    validator = _get_validator()
     is_valid, beautified, errors = validator.validate_and_beautify(sql)
 
-    print(f"Original SQL:\n{sql}")
-    print(f"\nValid: {is_valid}")
+    out.append(f"Original SQL:\n{sql}")
+    out.append(f"\nValid: {is_valid}")
 
     if not is_valid:
-        print(f"\n❌ Validation Errors:")
+        out.append(f"\n❌ Validation Errors:")
         for error in errors:
-            print(f"  • {error}")
+            out.append(f"  • {error}")
 
 
 def demo_empty_sql():
     """Demonstrate validation of empty SQL."""
-    print("\n\n🔴 DEMO 5: Empty SQL Query")
+    out.append("\n\n🔴 DEMO 5: Empty SQL Query")
     print_separator()
 
     sql = ""
 
-    validator = SQLValidator()
+    validator = _get_validator()
     is_valid, beautified, errors = validator.validate_and_beautify(sql)
 
-    print(f"Original SQL: '{sql}'")
-    print(f"\nValid: {is_valid}")
+    out.append(f"Original SQL: '{sql}'")
+    out.append(f"\nValid: {is_valid}")
 
     if not is_valid:
-        print(f"\n❌ Validation Errors:")
+        out.append(f"\n❌ Validation Errors:")
         for error in errors:
-            print(f"  • {error}")
+            out.append(f"  • {error}")
 
 
 def demo_complex_query():
     """Demonstrate validation and beautification of complex query."""
-    print("\n\n🟢 DEMO 6: Complex Query with Joins and Subqueries")
+    out.append("\n\n🟢 DEMO 6: Complex Query with Joins and Subqueries")
     print_separator()
 
     sql = """
@@ -119,19 +134,19 @@ def demo_complex_query():
     GROUP BY u.id,u.name HAVING COUNT(o.id)>5 ORDER BY order_count DESC LIMIT 10
     """
 
-    validator = SQLValidator()
+    validator = _get_validator()
     is_valid, beautified, errors = validator.validate_and_beautify(sql)
 
-    print(f"Original SQL (compact):\n{sql}")
-    print(f"\nValid: {is_valid}")
+    out.append(f"Original SQL (compact):\n{sql}")
+    out.append(f"\nValid: {is_valid}")
 
     if is_valid:
-        print(f"\n✨ Beautified SQL:\n{beautified}")
+        out.append(f"\n✨ Beautified SQL:\n{beautified}")
 
 
 def demo_dialect_specific():
     """Demonstrate dialect-specific validation."""
-    print("\n\n🟢 DEMO 7: PostgreSQL-specific Query")
+    out.append("\n\n🟢 DEMO 7: PostgreSQL-specific Query")
     print_separator()
 
     sql = """
@@ -140,20 +155,20 @@ def demo_dialect_specific():
     LIMIT 10
     """
 
-    validator = SQLValidator(dialect="postgres")
+    validator = _get_validator("postgres")
     is_valid, beautified, errors = validator.validate_and_beautify(sql)
 
-    print(f"Original SQL:\n{sql}")
-    print(f"\nValid: {is_valid} (PostgreSQL dialect)")
+    out.append(f"Original SQL:\n{sql}")
+    out.append(f"\nValid: {is_valid} (PostgreSQL dialect)")
 
     if is_valid:
-        print(f"\n✨ Beautified SQL:\n{beautified}")
+        out.append(f"\n✨ Beautified SQL:\n{beautified}")
 
 
 if __name__ == "__main__":
-    print("\n" + "=" * 80)
-    print(" " * 20 + "SQL VALIDATOR & BEAUTIFIER DEMO")
-    print("=" * 80)
+    out.append("\n" + SEP80)
+    out.append(" " * 20 + "SQL VALIDATOR & BEAUTIFIER DEMO")
+    out.append(SEP80)
 
     demo_valid_sql()
     demo_invalid_syntax()
@@ -163,6 +178,8 @@ if __name__ == "__main__":
     demo_complex_query()
     demo_dialect_specific()
 
-    print("\n" + "=" * 80)
-    print(" " * 30 + "DEMO COMPLETE")
-    print("=" * 80 + "\n")
+    out.append("\n" + SEP80)
+    out.append(" " * 30 + "DEMO COMPLETE")
+    out.append(SEP80 + "\n")
+
+    sys.stdout.write("\n".join(out) + "\n")
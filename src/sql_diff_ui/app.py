@@ -3,9 +3,117 @@
 import streamlit as st
 
 from sql_diff_ui.diff_engine import compare_sql
-from sql_diff_ui.models import Severity
+from sql_diff_ui.models import DiffCategory, Severity
 from sql_diff_ui.sql_validator import SQLValidator
 
+# Static UI data, built once at import instead of on every Streamlit rerun
+DIALECT_OPTIONS = (
+    "auto", "tsql", "postgres", "mysql", "sqlite", "bigquery", "snowflake", "oracle", "redshift"
+)
+
+# Colored icon shown before each notice, per severity
+SEVERITY_PREFIX = {
+    Severity.INFO: ":blue[ℹ️]",
+    Severity.WARN: ":orange[⚠️]",
+}
+
+# Text diffs with more lines than this are previewed instead of rendered in full
+TEXT_DIFF_PREVIEW_LINES = 500
+
+# Custom CSS for toast notifications with warning icon (light yellow background)
+TOAST_CSS = """
+<style>
+div[data-testid="stToast"] {
+    background-color: #fff8dc !important;
+    border-left: 5px solid #ffd700 !important;
+}
+
+div[data-testid="stToast"] > div {
+    background-color: #fff8dc !important;
+}
+</style>
+"""
+
+DEFAULT_SQL_A = (
+    "SELECT id, name, email\n"
+    "FROM users\n"
+    "WHERE status = 'active'\n"
+    "ORDER BY created_at DESC\n"
+    "LIMIT 10"
+)
+
+DEFAULT_SQL_B = (
+    "SELECT id, name, phone\n"
+    "FROM users\n"
+    "LEFT JOIN orders ON users.id = orders.user_id\n"
+    "WHERE status = 'active' AND role = 'customer'\n"
+    "ORDER BY created_at DESC\n"
+    "LIMIT 20"
+)
+
+
+@st.cache_resource
+def get_validator(dialect: str = "auto") -> SQLValidator:
+    """Return the process-wide SQLValidator for a dialect (stateless, safe to share)."""
+    return SQLValidator(dialect=dialect)
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _validate_and_beautify(sql: str, dialect: str):
+    """Validate and beautify SQL, memoized on (sql, dialect)."""
+    return get_validator(dialect).validate_and_beautify(sql)
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _cached_compare(
+    sql_a: str,
+    sql_b: str,
+    normalize: bool,
+    ignore_whitespace: bool,
+    case_insensitive_keywords: bool,
+    semantic_diff: bool,
+    dialect: str,
+):
+    """Run compare_sql, memoized on the SQL strings and option flags."""
+    return compare_sql(
+        sql_a=sql_a,
+        sql_b=sql_b,
+        normalize=normalize,
+        ignore_whitespace=ignore_whitespace,
+        case_insensitive_keywords=case_insensitive_keywords,
+        semantic_diff=semantic_diff,
+        dialect=dialect,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _number_lines(sql: str) -> str:
+    """Prefix each line of SQL with its line number."""
+    lines = sql.split('\n')
+    # Filter out completely blank lines but keep lines with whitespace
+    return '\n'.join(f"{i+1:4d} | {line}" for i, line in enumerate(lines) if line)
+
+
+def _render_errors(errors) -> None:
+    """Show one st.error per validation error, with its line number when known."""
+    for error in errors:
+        line = getattr(error, "line", None)
+        if line:
+            st.error(f"  **Line {line}:** {error.message}")
+        else:
+            st.error(f"  • {error}")
+
+
+def _show_match_toast(result) -> None:
+    """Show a toast summarizing whether the compared queries match."""
+    if result.notices:
+        st.toast(
+            f"SQL Queries Do Not Match! Found {len(result.notices)} differences.",
+            icon="⚠️"
+        )
+    else:
+        st.toast("SQL Queries Match! Queries are structurally identical.", icon="✅")
+
 
 @st.dialog("✅ SQL Validator")
 def validate_single_query():
@@ -15,7 +123,7 @@ def validate_single_query():
     # Dialect selection in dialog
     val_dialect = st.selectbox(
         "SQL Dialect",
-        options=["auto", "tsql", "postgres", "mysql", "sqlite", "bigquery", "snowflake", "oracle", "redshift"],
+        options=DIALECT_OPTIONS,
         index=0,
         help="Select the SQL dialect for validation",
         key="validator_dialect"
@@ -31,36 +139,26 @@ def validate_single_query():
     
     # Validate button
     if st.button("🔍 Validate SQL", type="primary", use_container_width=True):
-        if not sql_input.strip():
+        if not sql_input or sql_input.isspace():
             st.error("⚠️ Please enter a SQL query to validate.")
         else:
-            # Create validator with selected dialect
-            validator = SQLValidator(dialect=val_dialect)
-            
-            # Validate the SQL
+            # Validate the SQL (cached on SQL + dialect)
             with st.spinner("Validating SQL..."):
-                is_valid, errors = validator.validate_sql(sql_input)
+                is_valid, beautified, errors = _validate_and_beautify(sql_input, val_dialect)
             
             # Show results
             if is_valid:
                 st.success("✅ **SQL is Valid!**")
                 st.balloons()
                 
-                # Try to beautify and show
-                try:
-                    beautified = validator.beautify_sql(sql_input)
+                # Show beautified SQL unless beautification failed
+                if not errors:
                     with st.expander("🎨 View Beautified SQL", expanded=True):
                         st.code(beautified, language="sql")
-                except Exception:
-                    pass
             else:
                 st.error("❌ **SQL Validation Failed**")
                 st.markdown("**Errors found:**")
-                for error in errors:
-                    if hasattr(error, 'line') and error.line:
-                        st.error(f"  **Line {error.line}:** {error.message}")
-                    else:
-                        st.error(f"  • {error}")
+                _render_errors(errors)
                 
                 # Show dialect warning if using auto-detect
                 if val_dialect == "auto":
@@ -69,6 +167,147 @@ def validate_single_query():
                         "Please select the specific SQL dialect from the dropdown above."
                     )
 
+
+@st.fragment
+def _render_results(sql_a: str, sql_b: str):
+    """Render the comparison results section.
+
+    Runs as a fragment so the view toggles inside it ("Show line numbers",
+    "Show text diff", "Show full diff") rerun only this section instead of
+    the whole page.
+    """
+    st.markdown("---")
+    st.header("📊 Comparison Results")
+
+    # View-only toggles; keyed so their state persists across reruns
+    view_opt1, view_opt2, _ = st.columns([1, 1, 4])
+    with view_opt1:
+        show_line_numbers = st.checkbox(
+            "Show line numbers",
+            value=True,
+            key="show_line_numbers",
+            help="Display SQL queries with line numbers",
+        )
+    with view_opt2:
+        show_text_diff = st.checkbox(
+            "Show text diff",
+            value=True,
+            key="show_text_diff",
+            help="Display text difference between queries",
+        )
+
+    st.markdown("")  # Add spacing
+
+    # If validation errors, show only line numbers tab
+    if st.session_state.get("has_validation_errors", False):
+        # SQL with Line Numbers view only when validation errors
+        if show_line_numbers:
+            view_col1, view_col2 = st.columns(2)
+
+            with view_col1:
+                st.markdown("**SQL A with line numbers**")
+                st.code(_number_lines(sql_a), language="sql", line_numbers=False)
+
+            with view_col2:
+                st.markdown("**SQL B with line numbers**")
+                st.code(_number_lines(sql_b), language="sql", line_numbers=False)
+        else:
+            st.info("Enable 'Show line numbers' option to view SQL queries with line numbers.")
+
+    # If no validation errors, show full comparison results with tabs
+    elif "comparison_result" in st.session_state:
+        result = st.session_state["comparison_result"]
+        beautified_a = st.session_state.get("beautified_a", "")
+        beautified_b = st.session_state.get("beautified_b", "")
+
+        # Create tabs for different views; the Text Diff tab is only emitted
+        # when there is a diff to show, so identical queries render no empty tab
+        tab_labels = ["📋 Difference Notices", "🎨 View Beautified SQL", "📝 SQL with Line Numbers"]
+        if result.text_diff:
+            tab_labels.append("📊 Text Diff")
+        tab1, tab2, tab3, *tab_rest = st.tabs(tab_labels)
+
+        with tab1:
+            # Difference Notices tab
+            if result.parse_error:
+                st.warning(f"⚠️ {result.parse_error}")
+                st.info("Showing text diff only.")
+
+            if result.notices:
+                # Severity counts and category buckets are precomputed with the result
+                info_count = result.severity_counts[Severity.INFO]
+                warn_count = result.severity_counts[Severity.WARN]
+
+                st.markdown(
+                    f"**Breakdown:** {info_count} info, {warn_count} warnings"
+                )
+
+                # Display notices by category, in clause order (DiffCategory order)
+                for category in DiffCategory:
+                    notices = result.notices_for(category)
+                    if not notices:
+                        continue
+                    label = f"**{category.value}** ({len(notices)} changes)"
+                    with st.expander(label, expanded=True):
+                        for notice in notices:
+                            prefix = SEVERITY_PREFIX[notice.severity]
+                            st.markdown(f"{prefix} **{notice.summary}**")
+                            if notice.details:
+                                st.caption(notice.details)
+            else:
+                st.success("✅ No differences found. The queries are structurally identical.")
+
+        with tab2:
+            # Beautified SQL tab
+            beautify_col1, beautify_col2 = st.columns(2)
+
+            with beautify_col1:
+                st.markdown("**Beautified SQL A**")
+                st.code(beautified_a, language="sql")
+
+            with beautify_col2:
+                st.markdown("**Beautified SQL B**")
+                st.code(beautified_b, language="sql")
+
+        with tab3:
+            # SQL with Line Numbers tab
+            if show_line_numbers:
+                view_col1, view_col2 = st.columns(2)
+
+                with view_col1:
+                    st.markdown("**SQL A with line numbers**")
+                    st.code(_number_lines(sql_a), language="sql", line_numbers=False)
+
+                with view_col2:
+                    st.markdown("**SQL B with line numbers**")
+                    st.code(_number_lines(sql_b), language="sql", line_numbers=False)
+            else:
+                st.info("Enable 'Show line numbers' option to view SQL queries with line numbers.")
+
+        if result.text_diff:
+            with tab_rest[0]:
+                # Text Diff tab
+                if show_text_diff:
+                    st.caption("Lines with '-' (red) are removed from SQL A, lines with '+' (green) are added in SQL B")
+                    # Show diff without line numbers to preserve color coding.
+                    # Large diffs are previewed; the full text is only sent on request.
+                    diff_lines = result.text_diff.split("\n")
+                    hidden = len(diff_lines) - TEXT_DIFF_PREVIEW_LINES
+                    if hidden > 0:
+                        if st.checkbox("Show full diff", value=False, key="show_full_diff"):
+                            st.code(result.text_diff, language="diff")
+                        else:
+                            st.code(
+                                "\n".join(diff_lines[:TEXT_DIFF_PREVIEW_LINES])
+                                + f"\n... ({hidden} more lines truncated) ...",
+                                language="diff",
+                            )
+                    else:
+                        st.code(result.text_diff, language="diff")
+                else:
+                    st.info("Enable 'Show text diff' option to view text differences.")
+
+
 # Page config
 st.set_page_config(
     page_title="SQL Diff UI",
@@ -76,23 +315,8 @@ st.set_page_config(
     layout="wide",
 )
 
-# Custom CSS for toast notification with light yellow background
-st.markdown(
-    """
-    <style>
-    /* Style for toast notifications with warning icon */
-    div[data-testid="stToast"] {
-        background-color: #fff8dc !important;
-        border-left: 5px solid #ffd700 !important;
-    }
-    
-    div[data-testid="stToast"] > div {
-        background-color: #fff8dc !important;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+# Toast CSS; emitted on every run since Streamlit drops elements a rerun skips
+st.markdown(TOAST_CSS, unsafe_allow_html=True)
 
 # Title and description
 st.title("🔍 SQL Query Comparison Tool")
@@ -109,12 +333,12 @@ with col_validator:
     if st.button("✅ Validate SQL", use_container_width=True, help="Validate a single SQL query", type="secondary"):
         validate_single_query()
 
-col_opt1, col_opt2, col_opt3, col_opt4, col_opt5, col_opt6 = st.columns(6)
+col_opt1, col_opt2, col_opt3, col_opt4 = st.columns(4)
 
 with col_opt1:
     dialect = st.selectbox(
         "SQL Dialect",
-        options=["auto", "tsql", "postgres", "mysql", "sqlite", "bigquery", "snowflake", "oracle", "redshift"],
+        options=DIALECT_OPTIONS,
         index=0,
         help="Select 'tsql' for SQL Server/T-SQL syntax (required for bracket notation like [Column Name])",
     )
@@ -138,20 +362,6 @@ with col_opt4:
         help="Enable semantic/structural analysis",
     )
 
-with col_opt5:
-    show_line_numbers = st.checkbox(
-        "Show line numbers",
-        value=True,
-        help="Display SQL queries with line numbers",
-    )
-
-with col_opt6:
-    show_text_diff = st.checkbox(
-        "Show text diff",
-        value=True,
-        help="Display text difference between queries",
-    )
-
 st.markdown("---")
 
 # Layout: Two columns for SQL inputs
@@ -159,16 +369,9 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("SQL A")
-    default_sql_a = (
-        "SELECT id, name, email\n"
-        "FROM users\n"
-        "WHERE status = 'active'\n"
-        "ORDER BY created_at DESC\n"
-        "LIMIT 10"
-    )
     sql_a = st.text_area(
         "SQL A",
-        value=default_sql_a,
+        value=DEFAULT_SQL_A,
         height=250,
         key="sql_a",
         label_visibility="collapsed",
@@ -176,38 +379,34 @@ with col1:
 
 with col2:
     st.subheader("SQL B")
-    default_sql_b = (
-        "SELECT id, name, phone\n"
-        "FROM users\n"
-        "LEFT JOIN orders ON users.id = orders.user_id\n"
-        "WHERE status = 'active' AND role = 'customer'\n"
-        "ORDER BY created_at DESC\n"
-        "LIMIT 20"
-    )
     sql_b = st.text_area(
         "SQL B",
-        value=default_sql_b,
+        value=DEFAULT_SQL_B,
         height=250,
         key="sql_b",
         label_visibility="collapsed",
     )
 
+# Every input that affects the comparison (view-only toggles excluded), kept as
+# the tuple itself so an unchanged-input check can't be fooled by a hash collision
+input_key = (sql_a, sql_b, dialect, ignore_whitespace, case_insensitive, semantic_diff)
+
 # Compare button
 st.markdown("---")
 if st.button("🔍 Compare SQL Queries", type="primary", use_container_width=True):
-    if not sql_a.strip() or not sql_b.strip():
+    if not sql_a or sql_a.isspace() or not sql_b or sql_b.isspace():
         st.error("⚠️ Please provide both SQL queries to compare.")
+    elif (
+        st.session_state.get("_last_input_key") == input_key
+        and "comparison_result" in st.session_state
+    ):
+        # Inputs unchanged since the last comparison; reuse the stored result
+        _show_match_toast(st.session_state["comparison_result"])
     else:
-        # Create validator
-        validator = SQLValidator(dialect=dialect)
-
-        # Validate and beautify SQL A
-        with st.spinner("Validating SQL A..."):
-            is_valid_a, beautified_a, errors_a = validator.validate_and_beautify(sql_a)
-
-        # Validate and beautify SQL B
-        with st.spinner("Validating SQL B..."):
-            is_valid_b, beautified_b, errors_b = validator.validate_and_beautify(sql_b)
+        # Validate and beautify both queries (cached on SQL + dialect)
+        with st.spinner("Validating SQL queries..."):
+            is_valid_a, beautified_a, errors_a = _validate_and_beautify(sql_a, dialect)
+            is_valid_b, beautified_b, errors_b = _validate_and_beautify(sql_b, dialect)
 
         # Display validation errors only (no success messages)
         validation_errors = []
@@ -221,12 +420,7 @@ if st.button("🔍 Compare SQL Queries", type="primary", use_container_width=Tru
         if validation_errors:
             for sql_name, errors in validation_errors:
                 st.error(f"❌ **{sql_name} has validation errors:**")
-                for error in errors:
-                    # Check if error has line number for better formatting
-                    if hasattr(error, 'line') and error.line:
-                        st.error(f"  **Line {error.line}:** {error.message}")
-                    else:
-                        st.error(f"  • {error}")
+                _render_errors(errors)
                 
                 # Show dialect warning if using auto-detect and parsing failed
                 if dialect == "auto":
@@ -244,8 +438,8 @@ if st.button("🔍 Compare SQL Queries", type="primary", use_container_width=Tru
         # Only proceed with comparison if both queries are valid
         if is_valid_a and is_valid_b:
             with st.spinner("Comparing SQL queries..."):
-                # Use beautified SQL for comparison
-                result = compare_sql(
+                # Use beautified SQL for comparison (cached on inputs + options)
+                result = _cached_compare(
                     sql_a=beautified_a,
                     sql_b=beautified_b,
                     normalize=True,
@@ -262,15 +456,11 @@ if st.button("🔍 Compare SQL Queries", type="primary", use_container_width=Tru
                 st.session_state["beautified_b"] = beautified_b
                 # Clear validation error flag
                 st.session_state["has_validation_errors"] = False
+                # Remember which inputs produced this result
+                st.session_state["_last_input_key"] = input_key
             
             # Show comparison status as toast notification
-            if result.notices:
-                st.toast(
-                    f"SQL Queries Do Not Match! Found {len(result.notices)} differences.",
-                    icon="⚠️"
-                )
-            else:
-                st.toast("SQL Queries Match! Queries are structurally identical.", icon="✅")
+            _show_match_toast(result)
         else:
             st.warning("⚠️ Cannot compare SQL queries with validation errors. Please fix the errors above and try again.")
             # Set validation error flag and show line numbers view
@@ -278,124 +468,11 @@ if st.button("🔍 Compare SQL Queries", type="primary", use_container_width=Tru
             # Clear previous comparison results
             if "comparison_result" in st.session_state:
                 del st.session_state["comparison_result"]
+            st.session_state.pop("_last_input_key", None)
 
 # Display results if available or if there are validation errors
 if "comparison_result" in st.session_state or st.session_state.get("has_validation_errors", False):
-    st.markdown("---")
-    st.header("📊 Comparison Results")
-    
-    st.markdown("")  # Add spacing
-    
-    # If validation errors, show only line numbers tab
-    if st.session_state.get("has_validation_errors", False):
-        # SQL with Line Numbers view only when validation errors
-        if show_line_numbers:
-            view_col1, view_col2 = st.columns(2)
-            
-            with view_col1:
-                st.markdown("**SQL A with line numbers**")
-                lines = sql_a.split('\n')
-                # Filter out completely blank lines but keep lines with whitespace
-                numbered_sql = '\n'.join([f"{i+1:4d} | {line}" for i, line in enumerate(lines) if line.strip() or line])
-                st.code(numbered_sql, language="sql", line_numbers=False)
-            
-            with view_col2:
-                st.markdown("**SQL B with line numbers**")
-                lines = sql_b.split('\n')
-                # Filter out completely blank lines but keep lines with whitespace
-                numbered_sql = '\n'.join([f"{i+1:4d} | {line}" for i, line in enumerate(lines) if line.strip() or line])
-                st.code(numbered_sql, language="sql", line_numbers=False)
-        else:
-            st.info("Enable 'Show line numbers' option to view SQL queries with line numbers.")
-    
-    # If no validation errors, show full comparison results with tabs
-    elif "comparison_result" in st.session_state:
-        result = st.session_state["comparison_result"]
-        beautified_a = st.session_state.get("beautified_a", "")
-        beautified_b = st.session_state.get("beautified_b", "")
-
-        # Create tabs for different views
-        tab1, tab2, tab3, tab4 = st.tabs(["📋 Difference Notices", "🎨 View Beautified SQL", "📝 SQL with Line Numbers", "📊 Text Diff"])
-        
-        with tab1:
-            # Difference Notices tab
-            if result.parse_error:
-                st.warning(f"⚠️ {result.parse_error}")
-                st.info("Showing text diff only.")
-
-            if result.notices:
-                # Count by severity
-                info_count = sum(1 for n in result.notices if n.severity == Severity.INFO)
-                warn_count = sum(1 for n in result.notices if n.severity == Severity.WARN)
-
-                st.markdown(
-                    f"**Breakdown:** {info_count} info, {warn_count} warnings"
-                )
-
-                # Group notices by category
-                categories = {}
-                for notice in result.notices:
-                    cat = notice.category.value
-                    if cat not in categories:
-                        categories[cat] = []
-                    categories[cat].append(notice)
-
-                # Display notices by category
-                for category, notices in sorted(categories.items()):
-                    with st.expander(f"**{category}** ({len(notices)} changes)", expanded=True):
-                        for notice in notices:
-                            severity_icon = "⚠️" if notice.severity == Severity.WARN else "ℹ️"
-                            severity_color = "orange" if notice.severity == Severity.WARN else "blue"
-
-                            st.markdown(f":{severity_color}[{severity_icon}] **{notice.summary}**")
-                            if notice.details:
-                                st.caption(notice.details)
-            else:
-                st.success("✅ No differences found. The queries are structurally identical.")
-        
-        with tab2:
-            # Beautified SQL tab
-            beautify_col1, beautify_col2 = st.columns(2)
-
-            with beautify_col1:
-                st.markdown("**Beautified SQL A**")
-                st.code(beautified_a, language="sql")
-
-            with beautify_col2:
-                st.markdown("**Beautified SQL B**")
-                st.code(beautified_b, language="sql")
-        
-        with tab3:
-            # SQL with Line Numbers tab
-            if show_line_numbers:
-                view_col1, view_col2 = st.columns(2)
-                
-                with view_col1:
-                    st.markdown("**SQL A with line numbers**")
-                    lines = sql_a.split('\n')
-                    # Filter out completely blank lines but keep lines with whitespace
-                    numbered_sql = '\n'.join([f"{i+1:4d} | {line}" for i, line in enumerate(lines) if line.strip() or line])
-                    st.code(numbered_sql, language="sql", line_numbers=False)
-                
-                with view_col2:
-                    st.markdown("**SQL B with line numbers**")
-                    lines = sql_b.split('\n')
-                    # Filter out completely blank lines but keep lines with whitespace
-                    numbered_sql = '\n'.join([f"{i+1:4d} | {line}" for i, line in enumerate(lines) if line.strip() or line])
-                    st.code(numbered_sql, language="sql", line_numbers=False)
-            else:
-                st.info("Enable 'Show line numbers' option to view SQL queries with line numbers.")
-        
-        with tab4:
-            # Text Diff tab
-            if show_text_diff and result.text_diff:
-                st.caption("Lines with '-' (red) are removed from SQL A, lines with '+' (green) are added in SQL B")
-                # Show diff without line numbers to preserve color coding
-                st.code(result.text_diff, language="diff")
-            elif not show_text_diff:
-                st.info("Enable 'Show text diff' option to view text differences.")
-            else:
-                st.info("No text differences to display.")
+    _render_results(sql_a, sql_b)
 
 # Footer
 st.markdown("---")
@@ -1,9 +1,14 @@
 """Core diff engine for comparing SQL queries."""
 
+import copy
 import difflib
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from functools import lru_cache
 
 import sqlglot
 from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect
 
 from .models import (
     ComparisonResult,
@@ -14,13 +19,32 @@ from .models import (
 )
 
 
-def normalize_sql(sql: str, dialect: str = "auto") -> str:
+@lru_cache(maxsize=16)
+def _resolve_dialect(dialect: str | Dialect = "auto") -> Dialect:
+    """Resolve a dialect name ("auto" for sqlglot's default) to a Dialect, once per name."""
+    # Use None for auto-detection (empty string is sqlglot's default)
+    return Dialect.get_or_raise(None if dialect == "auto" else dialect)
+
+
+@lru_cache(maxsize=32)
+def _parse_sql(sql: str, dialect: str | Dialect = "auto") -> exp.Expression:
+    """
+    Parse SQL, memoized on (sql, dialect).
+
+    The returned tree is shared between callers and must be treated as
+    read-only; generating SQL from it (``.sql()``) does not mutate it.
+    """
+    return sqlglot.parse_one(sql, dialect=_resolve_dialect(dialect))
+
+
+@lru_cache(maxsize=32)
+def normalize_sql(sql: str, dialect: str | Dialect = "auto") -> str:
     """
     Normalize SQL string using sqlglot.
 
     Args:
         sql: The SQL query string to normalize
-        dialect: SQL dialect to use for parsing
+        dialect: SQL dialect name (or resolved Dialect) to use for parsing
 
     Returns:
         Normalized SQL string
@@ -28,19 +52,17 @@ def normalize_sql(sql: str, dialect: str = "auto") -> str:
     Raises:
         sqlglot.errors.ParseError: If SQL cannot be parsed
     """
-    # Use None for auto-detection (empty string is sqlglot's default)
-    dialect_arg = None if dialect == "auto" else dialect
-    parsed = sqlglot.parse_one(sql, dialect=dialect_arg)
+    parsed = _parse_sql(sql, dialect)
     return parsed.sql(pretty=True, normalize=True)
 
 
-def extract_components(sql: str, dialect: str = "auto") -> SQLComponents:
+def extract_components(sql: str, dialect: str | Dialect = "auto") -> SQLComponents:
     """
     Extract structured components from SQL query.
 
     Args:
         sql: The SQL query string
-        dialect: SQL dialect to use for parsing
+        dialect: SQL dialect name (or resolved Dialect) to use for parsing
 
     Returns:
         SQLComponents with all extracted parts
@@ -48,25 +70,63 @@ def extract_components(sql: str, dialect: str = "auto") -> SQLComponents:
     Raises:
         sqlglot.errors.ParseError: If SQL cannot be parsed
     """
-    # Use None for auto-detection (empty string is sqlglot's default)
-    dialect_arg = None if dialect == "auto" else dialect
-    parsed = sqlglot.parse_one(sql, dialect=dialect_arg)
+    # Hand out a copy so callers can't corrupt the shared cached entry
+    return copy.deepcopy(_components_cached(sql, dialect, False))
+
+
+@lru_cache(maxsize=32)
+def _components_cached(
+    sql: str, dialect: str | Dialect, normalize: bool
+) -> SQLComponents:
+    """
+    Extract components, memoized on (sql, dialect, normalize).
+
+    Like ``_parse_sql``, the result is shared between callers and must be
+    treated as read-only. All three arguments are required and passed
+    positionally, since lru_cache keys omitted or keyword arguments
+    differently. Comparing an edited query against an unchanged
+    one then only walks the edited side's tree.
+    """
+    return _components_from_tree(_parse_sql(sql, dialect), normalize)
+
+
+def _components_from_tree(
+    parsed: exp.Expression, normalize: bool = False
+) -> SQLComponents:
+    """
+    Extract components from an already-parsed SQL expression.
+
+    Args:
+        parsed: The parsed SQL expression
+        normalize: If True, lowercase unquoted identifiers, matching what
+            extract_components would see after a normalize_sql round trip
+
+    Returns:
+        SQLComponents with all extracted parts
+    """
+    # One generator serves the whole extraction; node.sql() would build a
+    # new Generator on every call
+    to_sql = Dialect.get_or_raise(None).generator(normalize=normalize).generate
 
     # Extract SELECT expressions
     select_expressions = []
     if isinstance(parsed, exp.Select):
         for expr in parsed.expressions:
             if expr.alias:
-                select_expressions.append(f"{expr.this.sql()} AS {expr.alias}")
+                alias = expr.args["alias"]
+                alias_name = expr.alias
+                if normalize and isinstance(alias, exp.Identifier) and not alias.quoted:
+                    alias_name = alias_name.lower()
+                select_expressions.append(f"{to_sql(expr.this)} AS {alias_name}")
             else:
-                select_expressions.append(expr.sql())
+                select_expressions.append(to_sql(expr))
 
     # Extract FROM tables
     from_tables = []
     if parsed.args.get("from_"):
         from_expr = parsed.args["from_"]
         if from_expr.this:
-            from_tables.append(from_expr.this.sql())
+            from_tables.append(to_sql(from_expr.this))
 
     # Extract JOINs
     joins = []
@@ -74,8 +134,8 @@ def extract_components(sql: str, dialect: str = "auto") -> SQLComponents:
         for join in parsed.args["joins"]:
             join_info = {
                 "type": join.side if join.side else "INNER",
-                "table": join.this.sql(),
-                "on": join.args.get("on").sql() if join.args.get("on") else "",
+                "table": to_sql(join.this),
+                "on": to_sql(join.args["on"]) if join.args.get("on") else "",
             }
             joins.append(join_info)
 
@@ -83,20 +143,20 @@ def extract_components(sql: str, dialect: str = "auto") -> SQLComponents:
     where_predicates = []
     if parsed.args.get("where"):
         where_expr = parsed.args["where"].this
-        where_predicates = _split_predicates(where_expr)
+        where_predicates = _split_predicates(where_expr, to_sql)
 
     # Extract GROUP BY
     group_by = []
     if parsed.args.get("group"):
         group_expr = parsed.args["group"]
         for expr in group_expr.expressions:
-            group_by.append(expr.sql())
+            group_by.append(to_sql(expr))
 
     # Extract HAVING predicates
     having_predicates = []
     if parsed.args.get("having"):
         having_expr = parsed.args["having"].this
-        having_predicates = _split_predicates(having_expr)
+        having_predicates = _split_predicates(having_expr, to_sql)
 
     # Extract ORDER BY
     order_by = []
@@ -104,18 +164,18 @@ def extract_components(sql: str, dialect: str = "auto") -> SQLComponents:
         order_expr = parsed.args["order"]
         for expr in order_expr.expressions:
             direction = "DESC" if expr.args.get("desc") else "ASC"
-            order_by.append(f"{expr.this.sql()} {direction}")
+            order_by.append(f"{to_sql(expr.this)} {direction}")
 
     # Extract LIMIT and OFFSET
     limit = None
     offset = None
     if parsed.args.get("limit"):
-        limit = parsed.args["limit"].sql()
+        limit = to_sql(parsed.args["limit"])
     if parsed.args.get("offset"):
-        offset = parsed.args["offset"].sql()
+        offset = to_sql(parsed.args["offset"])
 
     # Extract subqueries
-    subqueries = _extract_subqueries(parsed)
+    subqueries = _extract_subqueries(parsed, to_sql)
 
     return SQLComponents(
         select_expressions=select_expressions,
@@ -131,26 +191,47 @@ def extract_components(sql: str, dialect: str = "auto") -> SQLComponents:
     )
 
 
-def _split_predicates(expr: exp.Expression) -> list[str]:
+def _split_predicates(
+    expr: exp.Expression, to_sql: Callable[[exp.Expression], str] = exp.Expression.sql
+) -> list[str]:
     """Split AND-joined predicates into individual conditions."""
     predicates = []
 
-    if isinstance(expr, exp.And):
-        # Recursively split AND expressions
-        predicates.extend(_split_predicates(expr.left))
-        predicates.extend(_split_predicates(expr.right))
-    else:
-        predicates.append(expr.sql())
+    # Walk the AND tree with an explicit stack (right pushed first so the left
+    # operand is emitted first); long generated WHERE clauses nest deeply
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, exp.And):
+            stack.append(node.right)
+            stack.append(node.left)
+        else:
+            predicates.append(to_sql(node))
 
     return predicates
 
 
-def _extract_subqueries(parsed: exp.Expression) -> list[dict[str, str]]:
+# Subquery location by the type of its immediate parent node. None of these
+# sqlglot node types has subclasses, so exact type lookup matches isinstance
+_SUBQUERY_PARENT_LOCATIONS = {
+    exp.In: "WHERE-IN",
+    exp.Exists: "WHERE-EXISTS",
+    exp.Where: "WHERE",
+    exp.From: "FROM",
+    exp.Join: "JOIN",
+    exp.Having: "HAVING",
+}
+
+
+def _extract_subqueries(
+    parsed: exp.Expression, to_sql: Callable[[exp.Expression], str] = exp.Expression.sql
+) -> list[dict[str, str]]:
     """
     Extract all subqueries from a SQL expression.
     
     Args:
         parsed: The parsed SQL expression
+        to_sql: Function that renders an expression as SQL
         
     Returns:
         List of subquery dicts with location and SQL
@@ -165,33 +246,19 @@ def _extract_subqueries(parsed: exp.Expression) -> list[dict[str, str]]:
         
         # Walk up the tree to find meaningful context
         if parent:
-            # Check immediate parent
-            if isinstance(parent, exp.In):
-                location = "WHERE-IN"
-            elif isinstance(parent, exp.Exists):
-                location = "WHERE-EXISTS"
-            elif isinstance(parent, exp.Where):
-                location = "WHERE"
-            elif isinstance(parent, exp.From):
-                location = "FROM"
-            elif isinstance(parent, exp.Join):
-                location = "JOIN"
-            elif isinstance(parent, exp.Having):
-                location = "HAVING"
-            else:
-                # Check if it's a scalar subquery in SELECT (parent would be Alias or Column)
-                grandparent = parent.parent if hasattr(parent, 'parent') else None
-                if grandparent and isinstance(grandparent, exp.Select):
+            # Check immediate parent (one dict lookup instead of an isinstance chain)
+            location = _SUBQUERY_PARENT_LOCATIONS.get(type(parent), "UNKNOWN")
+            if location == "UNKNOWN":
+                # Scalar subquery in SELECT (parent would be Alias or Column), or
+                # any other subquery wrapping a SELECT; find() stops at the first
+                # match, which is normally subquery.this itself
+                grandparent = parent.parent
+                if isinstance(grandparent, exp.Select) or subquery.find(exp.Select):
                     location = "SELECT"
-                # Check ancestors for SELECT context
-                elif any(isinstance(ancestor, exp.Select) for ancestor in subquery.walk(bfs=False)):
-                    # If nested in select expressions, it's likely a scalar subquery
-                    if not isinstance(parent, (exp.Where, exp.From, exp.Join, exp.Having)):
-                        location = "SELECT"
         
         subqueries.append({
             "location": location,
-            "sql": subquery.this.sql() if subquery.this else subquery.sql(),
+            "sql": to_sql(subquery.this or subquery),
         })
     
     return subqueries
@@ -213,12 +280,17 @@ def generate_text_diff(
     Returns:
         Unified diff string with colored annotations
     """
-    lines_a = sql_a.splitlines(keepends=True)
-    lines_b = sql_b.splitlines(keepends=True)
-
     if ignore_whitespace:
-        lines_a = [line.strip() + "\n" for line in lines_a if line.strip()]
-        lines_b = [line.strip() + "\n" for line in lines_b if line.strip()]
+        # Strip each line once; blank lines are dropped
+        lines_a = [line + "\n" for line in map(str.strip, sql_a.splitlines()) if line]
+        lines_b = [line + "\n" for line in map(str.strip, sql_b.splitlines()) if line]
+    else:
+        lines_a = sql_a.splitlines(keepends=True)
+        lines_b = sql_b.splitlines(keepends=True)
+
+    # Identical inputs have an empty diff; skip the matcher entirely
+    if lines_a == lines_b:
+        return ""
 
     diff = difflib.unified_diff(
         lines_a,
@@ -247,162 +319,61 @@ def generate_semantic_notices(
     """
     notices = []
 
-    # Compare SELECT expressions
-    select_added = set(components_b.select_expressions) - set(components_a.select_expressions)
-    select_removed = set(components_a.select_expressions) - set(components_b.select_expressions)
-
-    for expr in select_removed:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.SELECT,
-                summary=f"Removed column/expression: {_truncate(expr)}",
-                severity=Severity.WARN,
-            )
-        )
-
-    for expr in select_added:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.SELECT,
-                summary=f"Added column/expression: {_truncate(expr)}",
-                severity=Severity.INFO,
-            )
-        )
-
-    # Compare FROM tables
-    from_added = set(components_b.from_tables) - set(components_a.from_tables)
-    from_removed = set(components_a.from_tables) - set(components_b.from_tables)
-
-    for table in from_removed:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.FROM,
-                summary=f"Removed FROM table: {table}",
-                severity=Severity.WARN,
-            )
-        )
-
-    for table in from_added:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.FROM,
-                summary=f"Added FROM table: {table}",
-                severity=Severity.INFO,
-            )
-        )
-
-    # Compare JOINs
-    joins_a_set = {_join_signature(j) for j in components_a.joins}
-    joins_b_set = {_join_signature(j) for j in components_b.joins}
-
-    joins_added = joins_b_set - joins_a_set
-    joins_removed = joins_a_set - joins_b_set
-
-    for join_sig in joins_removed:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.JOIN,
-                summary=f"Removed JOIN: {join_sig}",
-                severity=Severity.WARN,
-            )
-        )
-
-    for join_sig in joins_added:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.JOIN,
-                summary=f"Added JOIN: {join_sig}",
-                severity=Severity.INFO,
-            )
-        )
-
-    # Compare WHERE predicates
-    where_added = set(components_b.where_predicates) - set(components_a.where_predicates)
-    where_removed = set(components_a.where_predicates) - set(components_b.where_predicates)
-
-    for pred in where_removed:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.WHERE,
-                summary=f"Removed WHERE condition: {_truncate(pred)}",
-                severity=Severity.WARN,
-            )
-        )
-
-    for pred in where_added:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.WHERE,
-                summary=f"Added WHERE condition: {_truncate(pred)}",
-                severity=Severity.INFO,
-            )
-        )
-
-    # Compare GROUP BY
-    group_added = set(components_b.group_by) - set(components_a.group_by)
-    group_removed = set(components_a.group_by) - set(components_b.group_by)
-
-    for col in group_removed:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.GROUP_BY,
-                summary=f"Removed GROUP BY column: {col}",
-                severity=Severity.WARN,
-            )
-        )
-
-    for col in group_added:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.GROUP_BY,
-                summary=f"Added GROUP BY column: {col}",
-                severity=Severity.INFO,
-            )
-        )
-
-    # Compare HAVING
-    having_added = set(components_b.having_predicates) - set(components_a.having_predicates)
-    having_removed = set(components_a.having_predicates) - set(components_b.having_predicates)
-
-    for pred in having_removed:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.HAVING,
-                summary=f"Removed HAVING condition: {_truncate(pred)}",
-                severity=Severity.WARN,
-            )
-        )
-
-    for pred in having_added:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.HAVING,
-                summary=f"Added HAVING condition: {_truncate(pred)}",
-                severity=Severity.INFO,
-            )
-        )
-
-    # Compare ORDER BY
-    order_added = set(components_b.order_by) - set(components_a.order_by)
-    order_removed = set(components_a.order_by) - set(components_b.order_by)
-
-    for col in order_removed:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.ORDER_BY,
-                summary=f"Removed ORDER BY: {col}",
-                severity=Severity.INFO,
-            )
-        )
-
-    for col in order_added:
-        notices.append(
-            DiffNotice(
-                category=DiffCategory.ORDER_BY,
-                summary=f"Added ORDER BY: {col}",
-                severity=Severity.INFO,
-            )
-        )
+    # Compare list-valued components: removed items first, then added ones
+    _emit_diff(
+        notices,
+        components_a.select_expressions,
+        components_b.select_expressions,
+        DiffCategory.SELECT,
+        "column/expression",
+        truncate=True,
+    )
+    _emit_diff(
+        notices,
+        components_a.from_tables,
+        components_b.from_tables,
+        DiffCategory.FROM,
+        "FROM table",
+    )
+    _emit_diff(
+        notices,
+        [_join_signature(j) for j in components_a.joins],
+        [_join_signature(j) for j in components_b.joins],
+        DiffCategory.JOIN,
+        "JOIN",
+    )
+    _emit_diff(
+        notices,
+        components_a.where_predicates,
+        components_b.where_predicates,
+        DiffCategory.WHERE,
+        "WHERE condition",
+        truncate=True,
+    )
+    _emit_diff(
+        notices,
+        components_a.group_by,
+        components_b.group_by,
+        DiffCategory.GROUP_BY,
+        "GROUP BY column",
+    )
+    _emit_diff(
+        notices,
+        components_a.having_predicates,
+        components_b.having_predicates,
+        DiffCategory.HAVING,
+        "HAVING condition",
+        truncate=True,
+    )
+    # ORDER BY changes don't alter which rows are returned, so removals are INFO
+    _emit_diff(
+        notices,
+        components_a.order_by,
+        components_b.order_by,
+        DiffCategory.ORDER_BY,
+        "ORDER BY",
+        removed_severity=Severity.INFO,
+    )
 
     # Compare LIMIT/OFFSET
     if components_a.limit != components_b.limit:
@@ -457,36 +428,25 @@ def generate_semantic_notices(
                 )
             )
 
-    # Compare subqueries - group by location for better reporting
-    subqueries_a_by_location = {}
+    # Compare subqueries - group by location for better reporting, counting
+    # occurrences of each subquery SQL per location in one pass per side
+    subqueries_a_by_location = defaultdict(Counter)
     for sq in components_a.subqueries:
-        loc = sq["location"]
-        if loc not in subqueries_a_by_location:
-            subqueries_a_by_location[loc] = []
-        subqueries_a_by_location[loc].append(sq["sql"])
+        subqueries_a_by_location[sq["location"]][sq["sql"]] += 1
 
-    subqueries_b_by_location = {}
+    subqueries_b_by_location = defaultdict(Counter)
     for sq in components_b.subqueries:
-        loc = sq["location"]
-        if loc not in subqueries_b_by_location:
-            subqueries_b_by_location[loc] = []
-        subqueries_b_by_location[loc].append(sq["sql"])
+        subqueries_b_by_location[sq["location"]][sq["sql"]] += 1
 
     # Check each location for changes
-    all_locations = set(subqueries_a_by_location.keys()) | set(
-        subqueries_b_by_location.keys()
-    )
-
-    for location in all_locations:
-        sqs_a = set(subqueries_a_by_location.get(location, []))
-        sqs_b = set(subqueries_b_by_location.get(location, []))
-
-        removed = sqs_a - sqs_b
-        added = sqs_b - sqs_a
+    empty = Counter()
+    for location in subqueries_a_by_location.keys() | subqueries_b_by_location.keys():
+        counts_a = subqueries_a_by_location.get(location, empty)
+        counts_b = subqueries_b_by_location.get(location, empty)
 
         # Report removed subqueries
-        for sq_sql in removed:
-            count_a = subqueries_a_by_location.get(location, []).count(sq_sql)
+        for sq_sql in counts_a.keys() - counts_b.keys():
+            count_a = counts_a[sq_sql]
             summary = f"Removed subquery in {location}"
             if count_a > 1:
                 summary += f" ({count_a} occurrences)"
@@ -500,8 +460,8 @@ def generate_semantic_notices(
             )
 
         # Report added subqueries
-        for sq_sql in added:
-            count_b = subqueries_b_by_location.get(location, []).count(sq_sql)
+        for sq_sql in counts_b.keys() - counts_a.keys():
+            count_b = counts_b[sq_sql]
             summary = f"Added subquery in {location}"
             if count_b > 1:
                 summary += f" ({count_b} occurrences)"
@@ -514,11 +474,10 @@ def generate_semantic_notices(
                 )
             )
 
-    # Report location-level changes (subquery count differences in same location)
-    for location in all_locations:
-        count_a = len(subqueries_a_by_location.get(location, []))
-        count_b = len(subqueries_b_by_location.get(location, []))
-        
+        # Report location-level changes (subquery count differences in same location)
+        count_a = counts_a.total()
+        count_b = counts_b.total()
+
         if count_a != count_b and count_a > 0 and count_b > 0:
             # Only report if there are subqueries in both but counts differ
             if count_b > count_a:
@@ -541,6 +500,55 @@ def generate_semantic_notices(
     return notices
 
 
+def _diff_lists(items_a: list[str], items_b: list[str]) -> tuple[set[str], set[str]]:
+    """Return (added, removed): items only in B, and items only in A."""
+    set_a = set(items_a)
+    set_b = set(items_b)
+    return set_b - set_a, set_a - set_b
+
+
+def _emit_diff(
+    notices: list[DiffNotice],
+    items_a: list[str],
+    items_b: list[str],
+    category: DiffCategory,
+    label: str,
+    removed_severity: Severity = Severity.WARN,
+    truncate: bool = False,
+) -> None:
+    """
+    Append "Removed <label>" / "Added <label>" notices for one component list.
+
+    Args:
+        notices: List the new notices are appended to
+        items_a: Component strings from SQL A
+        items_b: Component strings from SQL B
+        category: Category of the emitted notices
+        label: What the items are, e.g. "WHERE condition"
+        removed_severity: Severity of removal notices (additions are INFO)
+        truncate: Whether to shorten long items with _truncate
+    """
+    added, removed = _diff_lists(items_a, items_b)
+    fmt = _truncate if truncate else str
+
+    notices.extend(
+        DiffNotice(
+            category=category,
+            summary=f"Removed {label}: {fmt(item)}",
+            severity=removed_severity,
+        )
+        for item in removed
+    )
+    notices.extend(
+        DiffNotice(
+            category=category,
+            summary=f"Added {label}: {fmt(item)}",
+            severity=Severity.INFO,
+        )
+        for item in added
+    )
+
+
 def _join_signature(join: dict[str, str]) -> str:
     """Create a comparable signature for a JOIN."""
     return f"{join['type']} JOIN {join['table']} ON {join['on']}"
@@ -565,7 +573,7 @@ def compare_sql(
     ignore_whitespace: bool = True,
     case_insensitive_keywords: bool = True,
     semantic_diff: bool = True,
-    dialect: str = "auto",
+    dialect: str | Dialect = "auto",
 ) -> ComparisonResult:
     """
     Compare two SQL queries and generate comprehensive diff results.
@@ -577,7 +585,7 @@ def compare_sql(
         ignore_whitespace: Whether to ignore whitespace in text diff
         case_insensitive_keywords: Whether to treat keywords case-insensitively
         semantic_diff: Whether to perform semantic/structural diff
-        dialect: SQL dialect for parsing
+        dialect: SQL dialect name (or resolved Dialect) for parsing
 
     Returns:
         ComparisonResult with text diff and semantic notices
@@ -604,9 +612,17 @@ def compare_sql(
                 compare_a = sql_a_normalized
                 compare_b = sql_b_normalized
 
-            components_a = extract_components(compare_a, dialect=dialect)
-            components_b = extract_components(compare_b, dialect=dialect)
-            notices = generate_semantic_notices(components_a, components_b)
+            # Parse each side once (memoized, so this reuses normalize_sql's
+            # parse); components come from the same tree instead of
+            # re-parsing the normalized text, and are memoized themselves
+            if sql_a != sql_b:
+                components_a = _components_cached(sql_a, dialect, normalize)
+                components_b = _components_cached(sql_b, dialect, normalize)
+                notices = generate_semantic_notices(components_a, components_b)
+            else:
+                # Identical inputs have identical components, hence no notices;
+                # parsing SQL A still surfaces syntax errors
+                _parse_sql(sql_a, dialect)
 
         except Exception as e:
             parse_error = f"Semantic diff unavailable: {type(e).__name__}: {str(e)}"
@@ -629,3 +645,28 @@ def compare_sql(
         sql_b_normalized=sql_b_normalized,
         parse_error=parse_error,
     )
+
+
+def compare_sql_batch(
+    pairs: list[tuple[str, str]],
+    dialect: str | Dialect = "auto",
+    **options,
+) -> list[ComparisonResult]:
+    """
+    Compare several (sql_a, sql_b) pairs with one shared dialect.
+
+    The dialect is passed through unchanged, so the batch shares
+    memoized parses with plain compare_sql calls on the same SQL.
+
+    Args:
+        pairs: List of (sql_a, sql_b) tuples to compare
+        dialect: SQL dialect name (or resolved Dialect) for parsing
+        **options: Remaining keyword arguments forwarded to compare_sql
+
+    Returns:
+        List of ComparisonResult, one per input pair
+    """
+    return [
+        compare_sql(sql_a, sql_b, dialect=dialect, **options)
+        for sql_a, sql_b in pairs
+    ]
@@ -1,5 +1,6 @@
 """Data models for SQL diff results."""
 
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -26,7 +27,7 @@ class Severity(str, Enum):
     WARN = "WARN"
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffNotice:
     """A single difference notice with human-friendly description."""
 
@@ -37,14 +38,14 @@ class DiffNotice:
 
     def __str__(self) -> str:
         """Format notice for display."""
-        prefix = "⚠️" if self.severity == Severity.WARN else "ℹ️"
+        prefix = "⚠️" if self.severity is Severity.WARN else "ℹ️"
         text = f"{prefix} [{self.category.value}] {self.summary}"
         if self.details:
             text += f"\n   {self.details}"
         return text
 
 
-@dataclass
+@dataclass(slots=True)
 class SQLComponents:
     """Structured components extracted from a SQL query."""
 
@@ -60,7 +61,7 @@ class SQLComponents:
     subqueries: list[dict[str, str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Complete comparison result with text and semantic diffs."""
 
@@ -69,3 +70,29 @@ class ComparisonResult:
     sql_a_normalized: str | None = None
     sql_b_normalized: str | None = None
     parse_error: str | None = None
+
+    # Precomputed views of `notices` so the UI doesn't rescan the list; filled in
+    # one pass at construction and kept in step by add_notice
+    notices_by_category: dict[DiffCategory, list[DiffNotice]] = field(init=False)
+    severity_counts: Counter = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Bucket the initial notices by category and tally their severities."""
+        self.notices_by_category = {}
+        self.severity_counts = Counter()
+        for notice in self.notices:
+            self._index_notice(notice)
+
+    def add_notice(self, notice: DiffNotice) -> None:
+        """Append a notice, updating the category buckets and severity counts with it."""
+        self.notices.append(notice)
+        self._index_notice(notice)
+
+    def _index_notice(self, notice: DiffNotice) -> None:
+        """Record one notice in the category buckets and severity counts."""
+        self.notices_by_category.setdefault(notice.category, []).append(notice)
+        self.severity_counts[notice.severity] += 1
+
+    def notices_for(self, category: DiffCategory) -> list[DiffNotice]:
+        """Return the notices in one category, in the order they were generated."""
+        return self.notices_by_category.get(category, [])
@@ -1,26 +1,105 @@
 """SQL validation and beautification utilities."""
 
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
 
 import sqlglot
+from sqlglot.dialects.dialect import Dialect
 from sqlglot.errors import ParseError
 
-
+# Patterns used on every validation, compiled once at import time
+_RE_SQUOTED = re.compile(r"'[^']*'")
+_RE_PAREN = re.compile(r'[()]')
+_RE_DANGLING_VALUE = re.compile(r'\s+(\'[^\']*\'|"[^"]*"|\d+(?:\.\d+)?)')
+# Keyword patterns are matched against the SQL upper-cased once per validation;
+# one str.upper() plus case-sensitive matching beats re.IGNORECASE on every line
+_RE_CLAUSE_KEYWORD = re.compile(
+    r'^(SELECT|FROM|WHERE|GROUP\s+BY|GROUP|ORDER\s+BY|ORDER|BY|HAVING|LIMIT|OFFSET|UNION|JOIN|'
+    r'LEFT|RIGHT|INNER|OUTER|CROSS|AND|OR|THEN|ELSE|END|WHEN|CASE)\b'
+)
+_RE_BY = re.compile(r'^BY\b')
+# A clause keyword alone on its line; group 1 is the keyword
+_RE_LONE_CLAUSE = re.compile(
+    r'^(SELECT|FROM|WHERE|ORDER(?:\s+BY)?|GROUP(?:\s+BY)?|LIMIT|OFFSET|HAVING)\s*$'
+)
+_RE_CASE_KEYWORDS = re.compile(r'\b(CASE|END|WHEN|THEN)\b')
+
+# Parse results that are complete SQL statements (not just a column/identifier/literal):
+# SELECT, INSERT, UPDATE, DELETE, CREATE, ALTER, DROP, etc.
+_STATEMENT_TYPES = (
+    sqlglot.exp.Select,
+    sqlglot.exp.Insert,
+    sqlglot.exp.Update,
+    sqlglot.exp.Delete,
+    sqlglot.exp.Create,
+    sqlglot.exp.Drop,
+    sqlglot.exp.Alter,
+    sqlglot.exp.Merge,
+    sqlglot.exp.Union,
+    sqlglot.exp.With,
+    sqlglot.exp.Command,
+)
+
+# Nodes under which a bare column is a boolean condition rather than an operand
+_CONDITION_PARENTS = (
+    sqlglot.exp.Where,
+    sqlglot.exp.Having,
+    sqlglot.exp.And,
+    sqlglot.exp.Or,
+    sqlglot.exp.Not,
+    sqlglot.exp.Paren,
+)
+
+# Error for each clause keyword that is alone on a line with nothing following
+_EMPTY_CLAUSE_MESSAGES = {
+    "SELECT": "Empty SELECT clause - no columns specified",
+    "FROM": "Empty FROM clause - no table specified",
+    "WHERE": "Empty WHERE clause - no condition specified",
+    "ORDER BY": "Empty ORDER BY clause - no columns specified",
+    "GROUP BY": "Empty GROUP BY clause - no columns specified",
+    "LIMIT": "Empty LIMIT clause - no value specified",
+    "OFFSET": "Empty OFFSET clause - no value specified",
+    "HAVING": "Empty HAVING clause - no condition specified",
+}
+
+# Common SQL keyword typos, matched on word boundaries
+_COMMON_TYPOS = {
+    "SELCT": "SELECT",
+    "FORM": "FROM",
+    "WHRE": "WHERE",
+    "GROPU": "GROUP",
+    "ODER": "ORDER",
+    "HAVIG": "HAVING",
+}
+# String literals, quoted identifiers and comments are consumed without a capture so
+# that words inside them (e.g. "-- fill in the form") are not reported as typos
+_RE_TYPOS = re.compile(
+    r"'[^']*'|\"[^\"]*\"|--[^\n]*|/\*.*?\*/|\b(" + '|'.join(map(re.escape, _COMMON_TYPOS)) + r")\b",
+    re.DOTALL,
+)
+
+
+@lru_cache(maxsize=32)
+def _parse_cached(sql: str, dialect: Dialect) -> sqlglot.exp.Expression:
+    """
+    Parse SQL with strict error handling, memoized on (sql, dialect).
+
+    Parse errors are raised (and not cached). The returned tree is shared
+    between callers and must be treated as read-only.
+    """
+    return sqlglot.parse_one(sql, dialect=dialect, error_level="raise")
+
+
+@dataclass(slots=True)
 class ValidationError:
     """Represents a SQL validation error."""
 
-    def __init__(self, message: str, line: int = None, column: int = None):
-        """
-        Initialize validation error.
-
-        Args:
-            message: Error message
-            line: Line number where error occurred (if known)
-            column: Column number where error occurred (if known)
-        """
-        self.message = message
-        self.line = line
-        self.column = column
+    message: str
+    line: int | None = None  # Line number where error occurred (if known)
+    column: int | None = None  # Column number where error occurred (if known)
 
     def __str__(self) -> str:
         """Return formatted error message."""
@@ -34,14 +113,21 @@ class ValidationError:
 class SQLValidator:
     """Validates and beautifies SQL queries."""
 
+    __slots__ = ("dialect", "_dialect")
+
     def __init__(self, dialect: str = "auto"):
         """
         Initialize SQL validator.
 
         Args:
             dialect: SQL dialect to use for parsing
+
+        Raises:
+            ValueError: If the dialect is unknown
         """
         self.dialect = None if dialect == "auto" else dialect
+        # Resolve the dialect once rather than on every parse
+        self._dialect = Dialect.get_or_raise(self.dialect)
 
     def validate_sql(self, sql: str) -> Tuple[bool, list[ValidationError]]:
         """
@@ -53,53 +139,68 @@ class SQLValidator:
         Returns:
             Tuple of (is_valid, list of validation errors)
         """
+        is_valid, errors, _ = self._validate(sql)
+        return is_valid, errors
+
+    def validate_many(self, sqls: list[str]) -> list[Tuple[bool, list[ValidationError]]]:
+        """
+        Validate several SQL strings with this validator's dialect.
+
+        Queries are validated in order in this process, so repeated queries in
+        the batch are parsed only once thanks to the shared parse cache.
+
+        Args:
+            sqls: SQL query strings to validate
+
+        Returns:
+            List of (is_valid, list of validation errors), one per input query
+        """
+        return [self.validate_sql(sql) for sql in sqls]
+
+    def _validate(
+        self, sql: str
+    ) -> Tuple[bool, list[ValidationError], sqlglot.exp.Expression | None]:
+        """
+        Validate SQL syntax, also returning the parsed tree when valid.
+
+        Args:
+            sql: SQL query string to validate
+
+        Returns:
+            Tuple of (is_valid, list of validation errors, parsed expression or None)
+        """
         errors = []
 
         # Check if SQL is empty or just whitespace
         if not sql or not sql.strip():
             errors.append(ValidationError("SQL query is empty"))
-            return False, errors
+            return False, errors, None
 
         # Try to parse the SQL with strict error handling
         try:
-            parsed = sqlglot.parse_one(sql, dialect=self.dialect, error_level="raise")
+            parsed = _parse_cached(sql, self._dialect)
 
             # Check if parsed successfully
             if parsed is None:
                 errors.append(ValidationError("Failed to parse SQL query"))
-                return False, errors
+                return False, errors, None
             
             # Check if parsed result is a valid SQL statement (not just a column/identifier)
-            # Valid SQL statements: SELECT, INSERT, UPDATE, DELETE, CREATE, ALTER, DROP, etc.
-            valid_statement_types = (
-                sqlglot.exp.Select,
-                sqlglot.exp.Insert,
-                sqlglot.exp.Update,
-                sqlglot.exp.Delete,
-                sqlglot.exp.Create,
-                sqlglot.exp.Drop,
-                sqlglot.exp.Alter,
-                sqlglot.exp.Merge,
-                sqlglot.exp.Union,
-                sqlglot.exp.With,
-                sqlglot.exp.Command,
-            )
-            
-            if not isinstance(parsed, valid_statement_types):
+            if not isinstance(parsed, _STATEMENT_TYPES):
                 # It's not a SQL statement, just a column/identifier/literal
                 errors.append(ValidationError(
                     f"Invalid SQL: Input is not a valid SQL statement (parsed as {type(parsed).__name__}). "
                     "Expected a complete SQL query like SELECT, INSERT, UPDATE, etc."
                 ))
-                return False, errors
+                return False, errors, None
 
             # Additional validation checks
             errors.extend(self._validate_structure(parsed, sql))
 
             if errors:
-                return False, errors
+                return False, errors, None
 
-            return True, []
+            return True, [], parsed
 
         except ParseError as e:
             # Extract error details from ParseError
@@ -109,9 +210,14 @@ class SQLValidator:
             line = None
             column = None
 
-            # ParseError may contain line/column info in the message
+            # sqlglot records line/column for each error; use the first one
+            if e.errors and e.errors[0].get("line") is not None:
+                line = e.errors[0].get("line")
+                column = e.errors[0].get("col")
+
+            # Otherwise the message may contain line/column info
             # Format is typically "Error message. Line X, Col: Y"
-            if "Line" in error_msg and "Col" in error_msg:
+            elif "Line" in error_msg and "Col" in error_msg:
                 try:
                     # Extract line number
                     line_match = error_msg.split("Line")[1].split(",")[0].strip()
@@ -123,13 +229,15 @@ class SQLValidator:
                     pass
 
             errors.append(ValidationError(error_msg, line=line, column=column))
-            return False, errors
+            return False, errors, None
 
         except Exception as e:
             errors.append(ValidationError(f"Unexpected error: {type(e).__name__}: {str(e)}"))
-            return False, errors
+            return False, errors, None
 
-    def _validate_structure(self, parsed, sql: str) -> list[ValidationError]:
+    def _validate_structure(
+        self, parsed: sqlglot.exp.Expression, sql: str
+    ) -> list[ValidationError]:
         """
         Perform additional structural validation.
 
@@ -148,40 +256,57 @@ class SQLValidator:
             from_clause = parsed.find(sqlglot.exp.From)
             if from_clause and from_clause.this:
                 table = from_clause.this
-                # Check if table has no name (empty table)
+                # Check if table has no name (empty table). A named table never
+                # renders to empty SQL, so no need to regenerate it to check.
                 if isinstance(table, sqlglot.exp.Table):
-                    if not table.name or (hasattr(table, 'sql') and not table.sql().strip()):
+                    if not table.name:
                         errors.append(ValidationError("Empty FROM clause - no table specified"))
             
             # Check for SELECT with no expressions (empty SELECT *)
             if not parsed.expressions or (len(parsed.expressions) == 0):
                 errors.append(ValidationError("Empty SELECT clause - no columns specified"))
         
-        # Check for common SQL issues
-        sql_upper = sql.upper()
-
-        # Check for unbalanced parentheses - track line numbers
-        open_parens = []  # Stack to track opening parens with line numbers
-        unmatched_close_parens = []  # List of closing parens with no matching open
+        # Check for unbalanced parentheses and quotes - track line numbers.
+        # One pass over the lines handles both, skipping lines without the
+        # relevant character. The paren stack walk only runs when the totals
+        # (counted in C) differ: balanced totals can only be out of order inside
+        # literals or comments, which the parser has already accepted. Quotes
+        # are always checked per line so a string literal broken across lines
+        # is still reported.
+        total_open = sql.count('(')
+        total_close = sql.count(')')
+        check_parens = total_open != total_close
+
+        open_parens = []  # Stack of line numbers of opening parens
+        unmatched_close_parens = []  # Line numbers of closing parens with no matching open
+        single_quote_lines = []
+        double_quote_lines = []
         
         lines = sql.split('\n')
         for line_num, line in enumerate(lines, 1):
-            for char_pos, char in enumerate(line):
-                if char == '(':
-                    open_parens.append((line_num, char_pos))
-                elif char == ')':
-                    if open_parens:
+            if check_parens and ('(' in line or ')' in line):
+                for match in _RE_PAREN.finditer(line):
+                    if match.group() == '(':
+                        open_parens.append(line_num)
+                    elif open_parens:
                         open_parens.pop()  # Match with opening paren
                     else:
-                        unmatched_close_parens.append((line_num, char_pos))  # Extra closing paren
+                        unmatched_close_parens.append(line_num)  # Extra closing paren
+            
+            # Count non-escaped quotes: every quote minus those preceded by a backslash
+            if "'" in line:
+                single_quotes = line.count("'") - line.count("\\'")
+                if single_quotes % 2 != 0:
+                    single_quote_lines.append(line_num)
+            if '"' in line:
+                double_quotes = line.count('"') - line.count('\\"')
+                if double_quotes % 2 != 0:
+                    double_quote_lines.append(line_num)
         
         # Report unbalanced parentheses with line numbers
-        total_open = sum(1 for line in lines for c in line if c == '(')
-        total_close = sum(1 for line in lines for c in line if c == ')')
-        
         if open_parens:
             # Unmatched opening parentheses
-            unmatched_lines = sorted(set([line for line, pos in open_parens]))[:5]
+            unmatched_lines = sorted(set(open_parens))[:5]
             line_info = f" - Missing closing ')' - Check lines: {', '.join(map(str, unmatched_lines))}"
             errors.append(
                 ValidationError(
@@ -192,7 +317,7 @@ class SQLValidator:
         
         if unmatched_close_parens:
             # Extra closing parentheses
-            unmatched_lines = sorted(set([line for line, pos in unmatched_close_parens]))[:5]
+            unmatched_lines = sorted(set(unmatched_close_parens))[:5]
             line_info = f" - Extra closing ')' on lines: {', '.join(map(str, unmatched_lines))}"
             errors.append(
                 ValidationError(
@@ -201,27 +326,6 @@ class SQLValidator:
                 )
             )
 
-        # Check for unbalanced quotes - track line numbers
-        single_quote_lines = []
-        double_quote_lines = []
-        
-        for line_num, line in enumerate(lines, 1):
-            # Count non-escaped single quotes
-            single_quotes = 0
-            double_quotes = 0
-            i = 0
-            while i < len(line):
-                if line[i] == "'" and (i == 0 or line[i-1] != '\\'):
-                    single_quotes += 1
-                elif line[i] == '"' and (i == 0 or line[i-1] != '\\'):
-                    double_quotes += 1
-                i += 1
-            
-            if single_quotes % 2 != 0:
-                single_quote_lines.append(line_num)
-            if double_quotes % 2 != 0:
-                double_quote_lines.append(line_num)
-        
         # Report unbalanced quotes with line numbers
         if single_quote_lines:
             lines_info = f" on lines: {', '.join(map(str, single_quote_lines[:10]))}"
@@ -250,182 +354,100 @@ class SQLValidator:
         # If sqlglot can parse it without throwing ParseError, we trust it's valid.
 
         # Check for common SQL keywords typos (word boundary match only)
-        common_typos = {
-            "SELCT": "SELECT",
-            "FORM": "FROM",
-            "WHRE": "WHERE",
-            "GROPU": "GROUP",
-            "ODER": "ORDER",
-            "HAVIG": "HAVING",
-        }
-
-        import re
-        for typo, correct in common_typos.items():
-            # Use word boundary to avoid matching inside other words or string literals
-            if re.search(r'\b' + re.escape(typo) + r'\b', sql_upper):
+        # One pass over the upper-cased SQL finds every typo present
+        sql_upper = sql.upper()
+        found_typos = {typo for typo in _RE_TYPOS.findall(sql_upper) if typo}
+        for typo, correct in _COMMON_TYPOS.items():
+            if typo in found_typos:
                 errors.append(ValidationError(f"Possible typo: '{typo}' (did you mean '{correct}'?)"))
 
-        # Check for incomplete WHERE clauses - pattern like: column 'value' without operator
-        import re
-        # Look for: word followed by string literal without = or other comparison operator
-        incomplete_where_pattern = r'\b(\w+)\s+(\'[^\']*\'|\"[^\"]*\")\b'
-        matches = re.finditer(incomplete_where_pattern, sql)
-        for match in matches:
-            # Check if there's a comparison operator before the string
-            start_pos = match.start()
-            # Look back a few characters to see if there's an operator
-            context_start = max(0, start_pos - 10)
-            context = sql[context_start:start_pos].strip()
-            
-            # If no comparison operator found before this pattern, it's likely an error
-            if not any(op in context[-3:] for op in ['=', '>', '<', '!', 'IN', 'LIKE']):
-                column_name = match.group(1)
-                string_value = match.group(2)
+        # Check for incomplete conditions - pattern like: column 'value' without operator.
+        # sqlglot drops the dangling value, leaving a bare column as a boolean operand,
+        # so only those columns need a look at the source text that follows them.
+        for column in parsed.find_all(sqlglot.exp.Column):
+            if not isinstance(column.parent, _CONDITION_PARENTS):
+                continue
+            end = column.this.meta.get("end")
+            if end is None:
+                continue
+            match = _RE_DANGLING_VALUE.match(sql, end + 1)
+            if match:
                 errors.append(
                     ValidationError(
-                        f"Incomplete comparison: '{column_name} {string_value}' - missing comparison operator (=, !=, >, <, etc.)"
+                        f"Incomplete comparison: '{column.sql()} {match.group(1)}' - "
+                        "missing comparison operator (=, !=, >, <, etc.)",
+                        line=column.this.meta.get("line")
                     )
                 )
 
         # Check for empty SQL clauses (keywords without values)
         # Note: Need to handle multi-line SQL where a keyword appears on its own line
         # but the values continue on the next line
-        sql_lines = sql.upper().split('\n')
+        # Upper-cased lines are stripped once here and shared with the CASE/WHEN check below
+        upper_lines = sql_upper.split('\n')
+        stripped_lines = [line.strip() for line in upper_lines]
         
-        for i, line in enumerate(sql_lines):
-            line_stripped = line.strip()
-            
-            # Skip empty lines
-            if not line_stripped:
+        for i, line_stripped in enumerate(stripped_lines):
+            # Only lines holding nothing but a clause keyword can be empty or incomplete
+            match = _RE_LONE_CLAUSE.match(line_stripped)
+            if not match:
                 continue
+            keyword = ' '.join(match.group(1).split())
+            next_line = stripped_lines[i + 1] if i + 1 < len(stripped_lines) else None
             
-            # Check if the next line exists and has content (for multi-line statements)
-            next_line_has_content = False
-            next_line_is_keyword = False
-            
-            if i + 1 < len(sql_lines):
-                next_line = sql_lines[i + 1].strip()
-                # Check if next line is a SQL keyword/clause
-                next_line_is_keyword = bool(next_line) and re.match(
-                    r'^(SELECT|FROM|WHERE|GROUP\s+BY|GROUP|ORDER\s+BY|ORDER|BY|HAVING|LIMIT|OFFSET|UNION|JOIN|LEFT|RIGHT|INNER|OUTER|CROSS|AND|OR|THEN|ELSE|END|WHEN|CASE)\b',
-                    next_line
-                )
-                # Check if next line has actual content (not just another keyword or empty)
-                next_line_has_content = bool(next_line) and not next_line_is_keyword
-            
-            # If current line is a clause keyword and next line is also a keyword (or empty),
-            # then current clause is empty
-            is_clause_empty = not next_line_has_content
-            
-            # Check for incomplete multi-word keywords
-            # ORDER without BY
-            if re.match(r'^ORDER\s*$', line_stripped):
+            # Check for incomplete multi-word keywords: ORDER or GROUP without BY
+            if keyword in ('ORDER', 'GROUP'):
                 # Check if next line starts with BY
-                if i + 1 < len(sql_lines):
-                    next_line = sql_lines[i + 1].strip()
-                    if not re.match(r'^BY\b', next_line):
-                        errors.append(
-                            ValidationError(f"Incomplete keyword 'ORDER' - missing 'BY' (should be 'ORDER BY')", line=i+1)
-                        )
-                else:
+                if next_line is None or not _RE_BY.match(next_line):
                     errors.append(
-                        ValidationError(f"Incomplete keyword 'ORDER' - missing 'BY' (should be 'ORDER BY')", line=i+1)
-                    )
-            
-            # GROUP without BY
-            if re.match(r'^GROUP\s*$', line_stripped):
-                # Check if next line starts with BY
-                if i + 1 < len(sql_lines):
-                    next_line = sql_lines[i + 1].strip()
-                    if not re.match(r'^BY\b', next_line):
-                        errors.append(
-                            ValidationError(f"Incomplete keyword 'GROUP' - missing 'BY' (should be 'GROUP BY')", line=i+1)
+                        ValidationError(
+                            f"Incomplete keyword '{keyword}' - missing 'BY' "
+                            f"(should be '{keyword} BY')",
+                            line=i+1
                         )
-                else:
-                    errors.append(
-                        ValidationError(f"Incomplete keyword 'GROUP' - missing 'BY' (should be 'GROUP BY')", line=i+1)
                     )
+                continue
             
-            # Only flag as empty if there's no content on the next line OR next line is another keyword
-            # Check for SELECT with nothing after it (on same line or next line)
-            if re.match(r'^SELECT\s*$', line_stripped) and is_clause_empty:
-                errors.append(
-                    ValidationError(f"Empty SELECT clause - no columns specified", line=i+1)
-                )
-            
-            # Check for FROM with nothing after it
-            if re.match(r'^FROM\s*$', line_stripped) and is_clause_empty:
-                errors.append(
-                    ValidationError(f"Empty FROM clause - no table specified", line=i+1)
-                )
-            
-            # Check for WHERE with nothing after it
-            if re.match(r'^WHERE\s*$', line_stripped) and is_clause_empty:
-                errors.append(
-                    ValidationError(f"Empty WHERE clause - no condition specified", line=i+1)
-                )
-            
-            # Check for ORDER BY with nothing after it
-            if re.match(r'^ORDER\s+BY\s*$', line_stripped) and is_clause_empty:
-                errors.append(
-                    ValidationError(f"Empty ORDER BY clause - no columns specified", line=i+1)
-                )
-            
-            # Check for GROUP BY with nothing after it
-            if re.match(r'^GROUP\s+BY\s*$', line_stripped) and is_clause_empty:
-                errors.append(
-                    ValidationError(f"Empty GROUP BY clause - no columns specified", line=i+1)
-                )
-            
-            # Check for LIMIT with nothing after it
-            if re.match(r'^LIMIT\s*$', line_stripped) and is_clause_empty:
-                errors.append(
-                    ValidationError(f"Empty LIMIT clause - no value specified", line=i+1)
-                )
-            
-            # Check for OFFSET with nothing after it
-            if re.match(r'^OFFSET\s*$', line_stripped) and is_clause_empty:
-                errors.append(
-                    ValidationError(f"Empty OFFSET clause - no value specified", line=i+1)
-                )
-            
-            # Check for HAVING with nothing after it
-            if re.match(r'^HAVING\s*$', line_stripped) and is_clause_empty:
-                errors.append(
-                    ValidationError(f"Empty HAVING clause - no condition specified", line=i+1)
-                )
+            # Check if the next line exists and has content (for multi-line statements)
+            # If the next line is also a keyword (or empty or missing), the clause is empty
+            next_line_has_content = bool(next_line) and not _RE_CLAUSE_KEYWORD.match(next_line)
+            if not next_line_has_content:
+                errors.append(ValidationError(_EMPTY_CLAUSE_MESSAGES[keyword], line=i+1))
         
         # Check for unbalanced CASE/END and WHEN/THEN statements
-        # Count CASE and END keywords across all lines
-        sql_upper = sql.upper()
+        # Both errors need a CASE or WHEN somewhere, so a substring test
+        # skips the per-line keyword scan for the common case-free query
+        if 'CASE' not in sql_upper and 'WHEN' not in sql_upper:
+            return errors
+
+        # Count all four keywords across all lines in a single pass
         case_count = 0
         end_count = 0
+        when_count = 0
+        then_count = 0
         case_lines = []
-        end_lines = []
         
-        for i, line in enumerate(sql_lines, 1):
-            line_upper = line.upper()
-            
+        for i, (line, line_stripped) in enumerate(zip(upper_lines, stripped_lines), 1):
             # Skip comment lines
-            line_stripped = line.strip()
             if line_stripped.startswith('--') or line_stripped.startswith('/*'):
                 continue
             
             # Remove inline comments before counting
-            if '--' in line_upper:
-                line_upper = line_upper.split('--')[0]
+            if '--' in line:
+                line = line.split('--')[0]
             
-            # Count CASE keywords (as whole word)
-            case_matches = len(re.findall(r'\bCASE\b', line_upper))
+            # Find CASE/END/WHEN/THEN keywords (as whole words)
+            keywords = _RE_CASE_KEYWORDS.findall(line)
+            if not keywords:
+                continue
+            
+            case_matches = keywords.count('CASE')
             case_count += case_matches
             if case_matches > 0:
                 case_lines.extend([i] * case_matches)
-            
-            # Count END keywords (as whole word) 
-            end_matches = len(re.findall(r'\bEND\b', line_upper))
-            end_count += end_matches
-            if end_matches > 0:
-                end_lines.extend([i] * end_matches)
+            end_count += keywords.count('END')
+            when_count += keywords.count('WHEN')
+            then_count += keywords.count('THEN')
         
         if case_count > end_count:
             errors.append(
@@ -436,30 +458,6 @@ class SQLValidator:
             )
         
         # Check for WHEN without THEN - use counting approach similar to CASE/END
-        # Count total WHEN and THEN keywords
-        when_count = 0
-        then_count = 0
-        
-        for line in sql_lines:
-            line_upper = line.upper()
-            
-            # Skip comment lines
-            line_stripped = line.strip()
-            if line_stripped.startswith('--') or line_stripped.startswith('/*'):
-                continue
-            
-            # Remove inline comments before counting
-            if '--' in line_upper:
-                line_upper = line_upper.split('--')[0]
-            
-            # Count WHEN keywords (as whole word)
-            when_matches = len(re.findall(r'\bWHEN\b', line_upper))
-            when_count += when_matches
-            
-            # Count THEN keywords (as whole word)
-            then_matches = len(re.findall(r'\bTHEN\b', line_upper))
-            then_count += then_matches
-        
         # Only report error if WHEN count significantly exceeds THEN count
         # Allow some tolerance for ELSE clauses and complex conditions
         if when_count > then_count and (when_count - then_count) > 0:
@@ -492,19 +490,48 @@ class SQLValidator:
             raise ValueError("SQL query is empty")
 
         try:
-            parsed = sqlglot.parse_one(sql, dialect=self.dialect, error_level="raise")
-            # Use sqlglot's pretty printing with normalization
+            parsed = _parse_cached(sql, self._dialect)
+        except ParseError as e:
+            raise ValueError(f"Failed to beautify SQL: {type(e).__name__}: {str(e)}")
+        except ValueError:
+            # Re-raise ValueError as is
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to beautify SQL: {type(e).__name__}: {str(e)}")
+
+        return self._beautify_parsed(parsed, sql)
+
+    def _beautify_parsed(self, parsed: sqlglot.exp.Expression, sql: str) -> str:
+        """
+        Beautify an already-parsed query.
+
+        Args:
+            parsed: Parsed SQL expression
+            sql: Original SQL string, used to detect content lost in parsing
+
+        Returns:
+            Beautified SQL string
+
+        Raises:
+            ValueError: If the query loses content during parsing
+        """
+        try:
+            # Use sqlglot's pretty printing with normalization. This keeps the
+            # default copy: the tree is the shared _parse_cached entry, and the
+            # generator's transforms are allowed to modify the tree they are given
             beautified = parsed.sql(pretty=True, normalize=True)
             
             # Check for lost string literals
-            import re
-            original_strings = re.findall(r"'[^']*'", sql)
-            beautified_strings = re.findall(r"'[^']*'", beautified)
+            # (nothing to lose when the input has no literals, so skip scanning the output)
+            original_strings = _RE_SQUOTED.findall(sql)
+            beautified_strings = _RE_SQUOTED.findall(beautified) if original_strings else []
             
             if len(original_strings) > len(beautified_strings):
-                missing_strings = set(original_strings) - set(beautified_strings)
+                # Multiset difference, so a repeated literal dropped only once is still reported
+                missing_strings = Counter(original_strings) - Counter(beautified_strings)
                 raise ValueError(
-                    f"SQL parsing resulted in lost string literals: {', '.join(missing_strings)}. "
+                    "SQL parsing resulted in lost string literals: "
+                    f"{', '.join(missing_strings.elements())}. "
                     "This indicates a syntax error (possibly missing comparison operator)."
                 )
             
@@ -517,8 +544,6 @@ class SQLValidator:
             
             return beautified
 
-        except ParseError as e:
-            raise ValueError(f"Failed to beautify SQL: {type(e).__name__}: {str(e)}")
         except ValueError:
             # Re-raise ValueError as is
             raise
@@ -536,11 +561,12 @@ class SQLValidator:
             Tuple of (is_valid, beautified_sql, validation_errors)
             If validation fails, beautified_sql will be the original SQL
         """
-        is_valid, errors = self.validate_sql(sql)
+        is_valid, errors, parsed = self._validate(sql)
 
         if is_valid:
             try:
-                beautified = self.beautify_sql(sql)
+                # Reuse the tree from validation instead of parsing again
+                beautified = self._beautify_parsed(parsed, sql)
                 return True, beautified, []
             except ValueError as e:
                 # If beautification fails but validation passed, return original
@@ -4,10 +4,11 @@ import pytest
 
 from sql_diff_ui.diff_engine import (
     compare_sql,
+    compare_sql_batch,
     extract_components,
     normalize_sql,
 )
-from sql_diff_ui.models import DiffCategory, Severity
+from sql_diff_ui.models import ComparisonResult, DiffCategory, DiffNotice, Severity
 
 
 def test_normalize_sql():
@@ -65,6 +66,27 @@ def test_extract_components_with_group_by():
     assert len(components.having_predicates) > 0
 
 
+def test_extract_components_long_and_chain():
+    """Test that a WHERE clause with thousands of ANDs is split without recursion."""
+    where = " AND ".join(f"c{i} = {i}" for i in range(3000))
+
+    components = extract_components(f"SELECT a FROM t WHERE {where}")
+
+    assert len(components.where_predicates) == 3000
+    assert components.where_predicates[:2] == ["c0 = 0", "c1 = 1"]
+    assert components.where_predicates[-1] == "c2999 = 2999"
+
+
+def test_extract_components_returns_independent_copies():
+    """Test that mutating extracted components does not leak into later calls."""
+    sql = "SELECT id, name FROM users WHERE active = 1"
+
+    components = extract_components(sql)
+    components.select_expressions.append("oops")
+
+    assert extract_components(sql).select_expressions == ["id", "name"]
+
+
 def test_compare_sql_select_column_added():
     """Test detecting added SELECT column."""
     sql_a = "SELECT id, name FROM users"
@@ -227,5 +249,68 @@ def test_text_diff_generation():
     assert "---" in result.text_diff or "+++" in result.text_diff or len(result.text_diff) > 0
 
 
+def test_compare_sql_precomputes_notice_buckets():
+    """Test that notices are bucketed by category and severity counts are tallied."""
+    sql_a = "SELECT id, name, email FROM users LIMIT 10"
+    sql_b = "SELECT id, name, phone FROM users LIMIT 20"
+
+    result = compare_sql(sql_a, sql_b, semantic_diff=True)
+
+    assert sum(len(v) for v in result.notices_by_category.values()) == len(result.notices)
+    assert len(result.notices_by_category[DiffCategory.SELECT]) == 2
+    assert len(result.notices_by_category[DiffCategory.LIMIT]) == 1
+    select_notices = result.notices_by_category[DiffCategory.SELECT]
+    assert result.notices_for(DiffCategory.SELECT) == select_notices
+    assert result.notices_for(DiffCategory.JOIN) == []
+    assert result.severity_counts[Severity.WARN] == 1
+    assert result.severity_counts[Severity.INFO] == 2
+
+
+def test_comparison_result_views_follow_notices():
+    """Test that category and severity views cover notices added outside compare_sql."""
+    notice = DiffNotice(DiffCategory.WHERE, "Removed condition", severity=Severity.WARN)
+    result = ComparisonResult(text_diff="", notices=[notice])
+
+    assert result.notices_for(DiffCategory.WHERE) == [notice]
+    assert result.severity_counts[Severity.WARN] == 1
+
+    result.add_notice(DiffNotice(DiffCategory.SELECT, "Added column: email"))
+
+    assert result.notices_by_category[DiffCategory.SELECT][0].summary == "Added column: email"
+    assert result.severity_counts[Severity.INFO] == 1
+    assert len(result.notices) == 2
+
+
+def test_compare_sql_batch_matches_individual_calls():
+    """Test that batch comparison returns the same notices as compare_sql."""
+    pairs = [
+        ("SELECT id FROM users", "SELECT id, name FROM users"),
+        ("SELECT id FROM users LIMIT 10", "SELECT id FROM users LIMIT 20"),
+    ]
+
+    results = compare_sql_batch(pairs, dialect="postgres")
+
+    assert len(results) == 2
+    for (sql_a, sql_b), result in zip(pairs, results):
+        expected = compare_sql(sql_a, sql_b, dialect="postgres")
+        assert sorted(n.summary for n in result.notices) == sorted(
+            n.summary for n in expected.notices
+        )
+
+
+def test_compare_sql_normalized_components_match_round_trip():
+    """Test that components from the parsed tree match re-parsing normalize_sql output."""
+    sql = "SELECT ID, Name AS UserName FROM Users WHERE Status = 'active' ORDER BY ID"
+
+    result = compare_sql(sql, "SELECT 1", normalize=True)
+    round_trip = extract_components(result.sql_a_normalized)
+
+    removed = {n.summary for n in result.notices if n.summary.startswith("Removed column")}
+    assert removed == {
+        f"Removed column/expression: {expr}" for expr in round_trip.select_expressions
+    }
+    assert round_trip.select_expressions == ["id", "name AS username"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -131,5 +131,28 @@ def test_subquery_in_from_clause():
     assert any(sq["location"] == "FROM" for sq in components_a.subqueries)
 
 
+def test_compare_repeated_subquery_reports_occurrences():
+    """Test that a subquery added twice is reported once with its occurrence count."""
+    sql_a = """
+    SELECT id, (SELECT MAX(total) FROM orders) AS max_total
+    FROM users
+    """
+    sql_b = """
+    SELECT
+        id,
+        (SELECT MAX(total) FROM orders) AS max_total,
+        (SELECT COUNT(*) FROM orders) AS c1,
+        (SELECT COUNT(*) FROM orders) AS c2
+    FROM users
+    """
+
+    result = compare_sql(sql_a, sql_b, semantic_diff=True)
+    summaries = [n.summary for n in result.notices if n.category == DiffCategory.SUBQUERY]
+
+    assert "Added subquery in SELECT (2 occurrences)" in summaries
+    assert "Increased subquery count in SELECT: 1 → 3" in summaries
+    assert not any(s.startswith("Removed subquery") for s in summaries)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -5,18 +5,29 @@ import pytest
 from sql_diff_ui.sql_validator import SQLValidator, ValidationError
 
 
+@pytest.fixture(scope="module")
+def validator():
+    """One default-dialect validator shared by every test in this module."""
+    return SQLValidator()
+
+
+@pytest.fixture(scope="module")
+def pg_validator():
+    """One Postgres validator shared by every test in this module."""
+    return SQLValidator(dialect="postgres")
+
+
 class TestSQLValidator:
     """Test suite for SQLValidator."""
 
-    def test_valid_simple_select(self):
+    def test_valid_simple_select(self, validator):
         """Test validation of a simple valid SELECT query."""
-        validator = SQLValidator()
         is_valid, errors = validator.validate_sql("SELECT * FROM users")
 
         assert is_valid is True
         assert len(errors) == 0
 
-    def test_valid_complex_query(self):
+    def test_valid_complex_query(self, validator):
         """Test validation of a complex valid query."""
         sql = """
         SELECT u.id, u.name, COUNT(o.id) as order_count
@@ -28,41 +39,52 @@ class TestSQLValidator:
         ORDER BY order_count DESC
         LIMIT 10
         """
-        validator = SQLValidator()
         is_valid, errors = validator.validate_sql(sql)
 
         assert is_valid is True
         assert len(errors) == 0
 
-    def test_empty_sql(self):
+    def test_empty_sql(self, validator):
         """Test validation of empty SQL."""
-        validator = SQLValidator()
         is_valid, errors = validator.validate_sql("")
 
         assert is_valid is False
         assert len(errors) == 1
         assert "empty" in errors[0].message.lower()
 
-    def test_invalid_syntax(self):
+    def test_invalid_syntax(self, validator):
         """Test validation of SQL with syntax errors."""
-        validator = SQLValidator()
         is_valid, errors = validator.validate_sql("SELECT * FORM users")
 
         assert is_valid is False
         assert len(errors) > 0
 
-    def test_unbalanced_parentheses(self):
+    def test_typo_words_in_literals_and_comments(self, validator):
+        """Test that typo words inside strings or comments are not reported."""
+        sql = "-- fill in the form\nSELECT id FROM users WHERE kind = 'FORM'"
+        is_valid, errors = validator.validate_sql(sql)
+
+        assert is_valid is True
+        assert errors == []
+
+    def test_unbalanced_parentheses(self, validator):
         """Test detection of unbalanced parentheses."""
-        validator = SQLValidator()
         sql = "SELECT * FROM users WHERE (status = 'active' AND role = 'admin'"
         is_valid, errors = validator.validate_sql(sql)
 
         assert is_valid is False
         assert any("parentheses" in error.message.lower() for error in errors)
 
-    def test_unbalanced_quotes(self):
+    def test_parentheses_inside_literals_are_balanced(self, validator):
+        """Test that balanced parentheses inside string literals are not flagged."""
+        sql = "SELECT ')' AS closing, '(' AS opening FROM users"
+        is_valid, errors = validator.validate_sql(sql)
+
+        assert is_valid is True
+        assert errors == []
+
+    def test_unbalanced_quotes(self, validator):
         """Test detection of unbalanced quotes."""
-        validator = SQLValidator()
         sql = "SELECT * FROM users WHERE name = 'John"
         is_valid, errors = validator.validate_sql(sql)
 
@@ -70,9 +92,8 @@ class TestSQLValidator:
         # Should detect unbalanced quotes
         assert len(errors) > 0
 
-    def test_beautify_simple_query(self):
+    def test_beautify_simple_query(self, validator):
         """Test beautification of a simple query."""
-        validator = SQLValidator()
         sql = "select id,name from users where status='active'"
         beautified = validator.beautify_sql(sql)
 
@@ -80,9 +101,8 @@ class TestSQLValidator:
         assert beautified is not None
         assert len(beautified) > len(sql)
 
-    def test_beautify_complex_query(self):
+    def test_beautify_complex_query(self, validator):
         """Test beautification of a complex query."""
-        validator = SQLValidator()
         sql = "SELECT u.id,u.name,COUNT(o.id) FROM users u LEFT JOIN orders o ON u.id=o.user_id GROUP BY u.id"
         beautified = validator.beautify_sql(sql)
 
@@ -90,23 +110,28 @@ class TestSQLValidator:
         assert beautified is not None
         assert "\n" in beautified  # Should have line breaks
 
-    def test_beautify_invalid_sql(self):
+    def test_beautify_invalid_sql(self, validator):
         """Test that beautifying SQL with lost content raises an error."""
-        validator = SQLValidator()
 
         # Test with SQL that loses content during parsing (missing comparison operator)
         sql = "SELECT * FROM users WHERE role 'admin'"
         with pytest.raises(ValueError):
             validator.beautify_sql(sql)
 
-    def test_missing_comparison_operator(self):
+    def test_beautify_reports_lost_duplicate_literal(self, validator):
+        """Test that a literal dropped once but still present elsewhere is reported."""
+
+        sql = "SELECT id FROM users WHERE status = 'x' AND role 'x'"
+        with pytest.raises(ValueError, match="lost string literals: 'x'\\."):
+            validator.beautify_sql(sql)
+
+    def test_missing_comparison_operator(self, validator):
         """Test detection of missing comparison operator.
         
         Note: This test is dialect-dependent. Sqlglot may parse 'role \"customer\"'
         as valid syntax in some SQL dialects, so we don't enforce strict validation here.
         The test now simply verifies the validator doesn't crash on this input.
         """
-        validator = SQLValidator()
         sql = """
         SELECT id, name, phone
         FROM users
@@ -119,9 +144,25 @@ class TestSQLValidator:
         assert isinstance(is_valid, bool)
         assert isinstance(errors, list)
 
-    def test_validate_and_beautify_valid(self):
+    def test_missing_comparison_operator_before_value(self, validator):
+        """Test that a column directly followed by a value is flagged on its line."""
+        sql = "SELECT id\nFROM users\nWHERE active AND price 100\nORDER BY id"
+        is_valid, errors = validator.validate_sql(sql)
+
+        assert is_valid is False
+        assert len(errors) == 1
+        assert "Incomplete comparison: 'price 100'" in errors[0].message
+        assert errors[0].line == 3
+
+    def test_validate_many(self, validator):
+        """Test batch validation returns one result per query, in order."""
+        results = validator.validate_many(["SELECT id FROM users", "", "SELECT id FROM users"])
+
+        assert [is_valid for is_valid, _ in results] == [True, False, True]
+        assert results[1][1][0].message == "SQL query is empty"
+
+    def test_validate_and_beautify_valid(self, validator):
         """Test combined validation and beautification of valid SQL."""
-        validator = SQLValidator()
         sql = "select * from users where status='active'"
 
         is_valid, beautified, errors = validator.validate_and_beautify(sql)
@@ -130,9 +171,8 @@ class TestSQLValidator:
         assert beautified != sql  # Should be beautified
         assert len(errors) == 0
 
-    def test_validate_and_beautify_invalid(self):
+    def test_validate_and_beautify_invalid(self, validator):
         """Test combined validation and beautification of invalid SQL."""
-        validator = SQLValidator()
         sql = "SELECT * FORM users"
 
         is_valid, beautified, errors = validator.validate_and_beautify(sql)
@@ -141,19 +181,17 @@ class TestSQLValidator:
         assert beautified == sql  # Should return original
         assert len(errors) > 0
 
-    def test_dialect_specific_validation(self):
+    def test_dialect_specific_validation(self, pg_validator):
         """Test validation with specific SQL dialect."""
-        validator = SQLValidator(dialect="postgres")
         sql = "SELECT * FROM users LIMIT 10"
 
-        is_valid, errors = validator.validate_sql(sql)
+        is_valid, errors = pg_validator.validate_sql(sql)
 
         assert is_valid is True
         assert len(errors) == 0
 
-    def test_subquery_validation(self):
+    def test_subquery_validation(self, validator):
         """Test validation of queries with subqueries."""
-        validator = SQLValidator()
         sql = """
         SELECT * FROM users
         WHERE id IN (SELECT user_id FROM orders WHERE amount > 100)
@@ -176,9 +214,8 @@ class TestSQLValidator:
         assert "Line 10" in str(error3)
         assert "Column 5" in str(error3)
 
-    def test_empty_select_clause(self):
+    def test_empty_select_clause(self, validator):
         """Test detection of empty SELECT clause."""
-        validator = SQLValidator()
         sql = """
         SELECT
         FROM users
@@ -191,9 +228,8 @@ class TestSQLValidator:
         assert any("SELECT" in error.message and "empty" in error.message.lower() 
                    for error in errors)
 
-    def test_empty_from_clause(self):
+    def test_empty_from_clause(self, validator):
         """Test detection of empty FROM clause."""
-        validator = SQLValidator()
         sql = """
         SELECT *
         FROM
@@ -205,9 +241,8 @@ class TestSQLValidator:
         assert any("FROM" in error.message and "empty" in error.message.lower() 
                    for error in errors)
 
-    def test_empty_where_clause(self):
+    def test_empty_where_clause(self, validator):
         """Test detection of empty WHERE clause."""
-        validator = SQLValidator()
         sql = """
         SELECT *
         FROM users
@@ -219,9 +254,8 @@ class TestSQLValidator:
         assert any("WHERE" in error.message and "empty" in error.message.lower() 
                    for error in errors)
 
-    def test_empty_order_by_clause(self):
+    def test_empty_order_by_clause(self, validator):
         """Test detection of empty ORDER BY clause."""
-        validator = SQLValidator()
         sql = """
         SELECT *
         FROM users
@@ -233,9 +267,8 @@ class TestSQLValidator:
         assert any("ORDER BY" in error.message and "empty" in error.message.lower() 
                    for error in errors)
 
-    def test_empty_limit_clause(self):
+    def test_empty_limit_clause(self, validator):
         """Test detection of empty LIMIT clause."""
-        validator = SQLValidator()
         sql = """
         SELECT *
         FROM users
@@ -247,9 +280,8 @@ class TestSQLValidator:
         assert any("LIMIT" in error.message and "empty" in error.message.lower() 
                    for error in errors)
 
-    def test_multiple_empty_clauses(self):
+    def test_multiple_empty_clauses(self, validator):
         """Test detection of multiple empty clauses."""
-        validator = SQLValidator()
         sql = """
         SELECT
         FROM
@@ -270,9 +302,8 @@ class TestSQLValidator:
         assert any("ORDER BY" in msg for msg in error_messages)
         assert any("LIMIT" in msg for msg in error_messages)
 
-    def test_incomplete_order_keyword(self):
+    def test_incomplete_order_keyword(self, validator):
         """Test detection of ORDER without BY."""
-        validator = SQLValidator()
         sql = """
         SELECT *
         FROM users
@@ -287,9 +318,8 @@ class TestSQLValidator:
         assert any("ORDER" in error.message and "BY" in error.message and "Incomplete" in error.message
                    for error in errors)
 
-    def test_incomplete_group_keyword(self):
+    def test_incomplete_group_keyword(self, validator):
         """Test detection of GROUP without BY."""
-        validator = SQLValidator()
         sql = """
         SELECT category, COUNT(*)
         FROM products
@@ -301,9 +331,8 @@ class TestSQLValidator:
         assert any("GROUP" in error.message and "BY" in error.message and "Incomplete" in error.message
                    for error in errors)
 
-    def test_all_incomplete_keywords(self):
+    def test_all_incomplete_keywords(self, validator):
         """Test SQL with incomplete multi-word keywords."""
-        validator = SQLValidator()
         sql = """
         SELECT
         FROM
@@ -324,9 +353,8 @@ class TestSQLValidator:
         assert any("ORDER" in msg and "Incomplete" in msg for msg in error_messages)
         assert any("LIMIT" in msg and "empty" in msg.lower() for msg in error_messages)
 
-    def test_case_without_end(self):
+    def test_case_without_end(self, validator):
         """Test CASE statement without END."""
-        validator = SQLValidator()
         sql = """
         SELECT 
             id,
@@ -341,9 +369,8 @@ class TestSQLValidator:
         error_messages = [e.message for e in errors]
         assert any("CASE" in msg and "END" in msg for msg in error_messages)
 
-    def test_when_without_then(self):
+    def test_when_without_then(self, validator):
         """Test WHEN clause without THEN."""
-        validator = SQLValidator()
         sql = """
         SELECT 
             id,
@@ -359,9 +386,8 @@ class TestSQLValidator:
         error_messages = [e.message for e in errors]
         assert any("WHEN" in msg and "THEN" in msg for msg in error_messages)
 
-    def test_valid_case_statement(self):
+    def test_valid_case_statement(self, validator):
         """Test valid CASE statement."""
-        validator = SQLValidator()
         sql = """
         SELECT 
             id,
@@ -377,9 +403,8 @@ class TestSQLValidator:
         assert is_valid is True
         assert len(errors) == 0
 
-    def test_nested_case_statements(self):
+    def test_nested_case_statements(self, validator):
         """Test nested CASE statements - simplified to just verify they parse correctly."""
-        validator = SQLValidator()
         # Simplified SQL without extra indentation/whitespace that may be causing parsing issues
         sql = "SELECT id, CASE WHEN type = 'premium' THEN CASE WHEN status = 'active' THEN 'Premium Active' ELSE 'Premium Other' END ELSE 'Regular' END as user_type FROM users"
         is_valid, errors = validator.validate_sql(sql)